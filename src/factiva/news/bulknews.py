@@ -1,13 +1,28 @@
 """Implement actions with Bulk news such as Snapshot and Stream."""
+import ast
+import asyncio
+import functools
 import os
+import queue
+import random
+import threading
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
-from factiva.core import UserKey, const, req
+from factiva.core import UserKey, const
 from factiva.core.tools import mask_string
+from factiva.news import req
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_QUEUE_MAX_CHUNKS = 64
+API_JOB_INITIAL_WAIT = 1
+API_JOB_MAX_WAIT = 30
+# Share of long_poll_wait a status request has to take to count as held by the API
+LONG_POLL_HELD_RATIO = 0.5
+API_JOB_EXPECTED_STATES = frozenset(const.API_JOB_EXPECTED_STATES)
 
 
 def parse_field(field, field_name):
@@ -17,8 +32,8 @@ def parse_field(field, field_name):
     ----------
     field: str, dict
         field to be parsed. When a dictionary is given, it will return it
-        as is. When a string is provided it will return the eval version
-        of it, in order to return a dict
+        as is. When a string is provided it is parsed as a Python literal
+        (`ast.literal_eval`), in order to return a dict
     field_name: str
         name of the field to be parsed. It is displayed in the error message
         when the field type is not valid.
@@ -28,11 +43,111 @@ def parse_field(field, field_name):
         return field
 
     if isinstance(field, str):
-        return eval(field)
+        return ast.literal_eval(field)
 
     raise ValueError(f'Unexpected value for {field_name}')
 
 
+def get_poll_delay(wait, retry_after=None) -> float:
+    """Get the seconds to wait before checking the status of a job again.
+
+    Parameters
+    ----------
+    wait: int or float
+        Current base wait. Callers double it after every check, up to
+        API_JOB_MAX_WAIT.
+    retry_after: float, Optional
+        Value of the Retry-After header from the last response. When present,
+        it takes precedence over the base wait.
+
+    Returns
+    -------
+    Float with the seconds to sleep, including a jitter of up to 10%.
+
+    """
+    if retry_after is not None:
+        return retry_after
+    return min(wait + random.uniform(0, wait * 0.1), API_JOB_MAX_WAIT)
+
+
+def get_retry_after(response):
+    """Get the Retry-After header value in seconds, or None if it is missing or not numeric."""
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_class_name(cls) -> str:
+    """Get the string representation of a class (e.g. "<class 'module.Name'>"), computed once per class."""
+    return str(cls)
+
+
+class _FileWriter():
+    """Write downloaded chunks to disk from a single thread.
+
+    Download workers push `(path, chunk)` items to a bounded queue and a
+    single thread drains it, so disk writes are serialized and fast
+    downloads are slowed down by a slow disk instead of piling up in memory.
+    A `(path, None)` item closes the file.
+
+    """
+
+    def __init__(self, max_chunks=DOWNLOAD_QUEUE_MAX_CHUNKS):
+        """Initialize class and start the writer thread."""
+        self.error = None
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
+    def write(self, path, chunk):
+        """Queue a chunk to be appended to the file in path."""
+        self._queue.put((path, chunk))
+
+    def close_file(self, path):
+        """Queue the end of the file in path."""
+        self._queue.put((path, None))
+
+    def close(self, download_error=None):
+        """Wait until all queued chunks are written and stop the writer thread.
+
+        A write error is raised. When the downloads failed, download_error
+        is raised instead and the write error is chained to it, so the
+        caller still sees why the downloads failed.
+
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is None:
+            return
+        if download_error is None:
+            raise self.error
+        raise download_error from self.error
+
+    def _writer_loop(self):
+        open_files = {}
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                # Keep draining so producers are never blocked on a dead writer
+                continue
+            path, chunk = item
+            try:
+                if path not in open_files:
+                    open_files[path] = open(path, 'wb')
+                if chunk is None:
+                    open_files.pop(path).close()
+                else:
+                    open_files[path].write(chunk)
+            except Exception as error:  # pylint: disable=broad-except
+                self.error = error
+        for file_handle in open_files.values():
+            file_handle.close()
+
+
 class BulkNewsBase():
     """Represent actions with Bulk news such as Snapshot and Stream.
 
@@ -73,15 +188,13 @@ class BulkNewsBase():
 
     def __str__(self):
         """Create string representation for BulkNewsBase Class."""
-        pprop = self.__dict__.copy()
-        del pprop['user_key']
-        masked_key = mask_string(self.user_key.user_key)
-        user_class = str(self.user_key.__class__)
+        masked_key = mask_string(self.user_key.key)
+        user_class = get_class_name(self.user_key.__class__)
 
-        ret_val = str(self.__class__) + '\n'
-        ret_val += f'  user_key = {masked_key} ({user_class})\n'
-        ret_val += '  '.join(('{} = {}\n'.format(item, pprop[item]) for item in pprop))
-        return ret_val
+        parts = [get_class_name(self.__class__), '\n', f'  user_key = {masked_key} ({user_class})\n',
+                 '  '.join(f'{item} = {value}\n' for item, value in self.__dict__.items()
+                           if item != 'user_key' and not item.startswith('_'))]
+        return ''.join(parts)
 
     def __repr__(self):
         """Create string representation for BulkNewsBase Class."""
@@ -140,7 +253,7 @@ class BulkNewsQuery():  # pylint: disable=too-few-public-methods
             if isinstance(select_fields, list):
                 self.select_fields = select_fields  # TODO: Validate syntax if possible
             elif isinstance(select_fields, str):
-                self.select_fields = eval(select_fields)
+                self.select_fields = ast.literal_eval(select_fields)
             else:
                 raise ValueError("Unexpected value for select_fields")
 
@@ -170,6 +283,54 @@ class BulkNewsQuery():  # pylint: disable=too-few-public-methods
         return query_dict
 
 
+def _handle_job_submitted(job, response):
+    """Save the id, state and link of a job that was created by the API."""
+    response_data = req.api_json(response)
+    job.job_id = job.get_job_id(response_data)
+    job.job_state = response_data['data']['attributes']['current_state']
+    job.link = response_data['links']['self']
+
+
+def _handle_invalid_query(job, response):
+    raise ValueError(f'Invalid Query [{response.text}]')
+
+
+def _handle_job_status(job, response):
+    """Save the state of a job, and its results once it is done."""
+    response_data = req.api_json(response)
+    job.job_state = response_data['data']['attributes']['current_state']
+    if job.job_state == const.API_JOB_DONE_STATE:
+        job.set_job_data(response_data)
+    elif job.job_state == const.API_JOB_FAILED_STATE:
+        errors = response_data['errors']
+        raise RuntimeError(f"Job Failed with reason: {[e['title'] + e['detail'] for e in errors]}")
+
+
+def _handle_job_not_found(job, response):
+    raise RuntimeError('Job ID does not exist.')
+
+
+def _handle_bad_request(job, response):
+    detail = req.api_json(response)['errors'][0]['detail']
+    raise ValueError(f'Bad Request: {detail}')
+
+
+def _handle_unexpected_status(job, response):
+    raise RuntimeError(f'API request returned an unexpected HTTP status, with content [{response.text}]')
+
+
+# Response handlers by HTTP status code. Any other status is unexpected.
+_SUBMIT_HANDLERS = {
+    201: _handle_job_submitted,
+    400: _handle_invalid_query
+}
+_RESULTS_HANDLERS = {
+    200: _handle_job_status,
+    404: _handle_job_not_found,
+    400: _handle_bad_request
+}
+
+
 class BulkNewsJob():
     """Represent the operations of the base class.
 
@@ -195,6 +356,12 @@ class BulkNewsJob():
         fills account detail properties along with maximum, used and remaining
         values. It may take several seconds to complete.
 
+    Long polling is opt-in: when `long_poll_wait` is set to a number of
+    seconds, status requests ask the API to hold the response until the job
+    changes or the wait expires. The backoff sleep is only skipped when the
+    last response took long enough to show that the API held it. If the API
+    does not support it, the job falls back to regular polling.
+
     """
 
     job_id = ''
@@ -202,6 +369,9 @@ class BulkNewsJob():
     submitted_datetime = 0
     link = ''
     files = []
+    long_poll_wait = 0
+    _retry_after = None
+    _long_poll_held = False
 
     def __init__(self, user_key=None, user_key_stats=False):
         """Initialize Bulk news job class."""
@@ -209,6 +379,7 @@ class BulkNewsJob():
         self.job_state = ''
         self.submitted_datetime = datetime.now()
         self.link = ''
+        self.files = []
         self.user_key = UserKey.create_user_key(user_key, user_key_stats)
 
     def get_endpoint_url(self) -> str:
@@ -300,15 +471,7 @@ class BulkNewsJob():
 
         response = req.api_send_request(method='POST', endpoint_url=self.get_endpoint_url(), headers=headers_dict, payload=payload)
 
-        if response.status_code == 201:
-            response_data = response.json()
-            self.job_id = self.get_job_id(response_data)
-            self.job_state = response_data['data']['attributes']['current_state']
-            self.link = response_data['links']['self']
-        elif response.status_code == 400:
-            raise ValueError(f'Invalid Query [{response.text}]')
-        else:
-            raise RuntimeError(f'API request returned an unexpected HTTP status, with content [{response.text}]')
+        _SUBMIT_HANDLERS.get(response.status_code, _handle_unexpected_status)(self, response)
         return True
 
     def get_job_results(self) -> bool:
@@ -335,28 +498,32 @@ class BulkNewsJob():
             'Content-Type': 'application/json'
         }
 
-        response = req.api_send_request(method='GET', endpoint_url=self.link, headers=headers_dict)
-
-        if response.status_code == 200:
-            response_data = response.json()
-            self.job_state = response_data['data']['attributes']['current_state']
-            if self.job_state == const.API_JOB_DONE_STATE:
-                self.set_job_data(response_data)
-            elif self.job_state == const.API_JOB_FAILED_STATE:
-                errors = response_data['errors']
-                raise RuntimeError(f"Job Failed with reason: {[e['title'] + e['detail'] for e in errors]}")
-        elif response.status_code == 404:
-            raise RuntimeError('Job ID does not exist.')
-        elif response.status_code == 400:
-            detail = json.loads(response.text)['errors'][0]['detail']
-            raise ValueError(f'Bad Request: {detail}')
-        else:
-            raise RuntimeError(f'API request returned an unexpected HTTP status, with content [{response.text}]')
+        qs_params = {'wait': f'{self.long_poll_wait}s'} if self.long_poll_wait else None
+        start_time = time.monotonic()
+        response = req.api_send_request(method='GET', endpoint_url=self.link, headers=headers_dict, qs_params=qs_params)
+        if qs_params and response.status_code in (400, 501):
+            # Long polling not supported by the API. Fall back to regular polling.
+            self.long_poll_wait = 0
+            return self.get_job_results()
+        self._long_poll_held = bool(qs_params) and time.monotonic() - start_time >= self.long_poll_wait * LONG_POLL_HELD_RATIO
+        self._retry_after = get_retry_after(response)
+
+        _RESULTS_HANDLERS.get(response.status_code, _handle_unexpected_status)(self, response)
         return True
 
+    def _get_poll_delay(self, wait):
+        """Get the seconds to wait before the next status check. No wait is needed when the API held the last request."""
+        if self._long_poll_held:
+            return 0
+        return get_poll_delay(wait, self._retry_after)
+
     def process_job(self, payload=None, use_latest_api_version=False) -> bool:
         """Submit a new job to be processed, wait until the job is completed and then retrieves the job results.
 
+        The job status is checked with an exponential backoff, starting at
+        API_JOB_INITIAL_WAIT seconds and capped at API_JOB_MAX_WAIT seconds.
+        A Retry-After header sent by the API takes precedence.
+
         Parameters
         ----------
         payload: dict or str, Optional
@@ -378,18 +545,222 @@ class BulkNewsJob():
         self.submit_job(payload=payload, use_latest_api_version=use_latest_api_version)
         self.get_job_results()
 
+        wait = API_JOB_INITIAL_WAIT
         while self.job_state != const.API_JOB_DONE_STATE:
-            if self.job_state not in const.API_JOB_EXPECTED_STATES:
+            if self.job_state not in API_JOB_EXPECTED_STATES:
                 raise RuntimeError('Unexpected job state')
             if self.job_state == const.API_JOB_FAILED_STATE:
                 raise Exception('Job failed')
 
-            time.sleep(const.API_JOB_ACTIVE_WAIT_SPACING)
+            time.sleep(self._get_poll_delay(wait))
+            wait = min(wait * 2, API_JOB_MAX_WAIT)
             self.get_job_results()
 
         return True
 
-    def download_file(self, endpoint_url: str, download_path: str):
+    async def submit_job_async(self, payload=None, use_latest_api_version=False) -> bool:
+        """Coroutine version of `submit_job`.
+
+        The HTTP request runs in the default executor, so many jobs can be
+        submitted concurrently from a single event loop.
+
+        Parameters
+        ----------
+        payload: dict or str, Optional
+            Contains the payload required to create the new job.
+
+        Returns
+        -------
+        Boolean : True if the submission was successful. An Exception otherwise.
+
+        """
+        return await req.run_blocking(self.submit_job, payload=payload, use_latest_api_version=use_latest_api_version)
+
+    async def get_job_results_async(self) -> bool:
+        """Coroutine version of `get_job_results`.
+
+        Returns
+        -------
+        Boolean : True if the data was retrieved successfully. An Exception otherwise.
+
+        """
+        return await req.run_blocking(self.get_job_results)
+
+    async def process_job_async(self, payload=None, use_latest_api_version=False) -> bool:
+        """Coroutine version of `process_job`.
+
+        Waits between status checks are done with `asyncio.sleep`, so a
+        pending job does not hold a thread while it is being monitored.
+
+        Parameters
+        ----------
+        payload: dict or str, Optional
+            Contains the payload required to create the new job.
+
+        Returns
+        -------
+        Boolean : True if the job processing was successful. An Exception
+            otherwise.
+
+        Raises
+        ------
+        - RuntimeError when the job returns and unexpected state
+        - Exception when the job has failed to complete
+
+        Examples
+        --------
+        Running several analytics jobs concurrently
+            >>> jobs = [AnalyticsJob(user_key=my_key) for _ in queries]
+            >>> await asyncio.gather(*(job.process_job_async(q.get_analytics_query()) for job, q in zip(jobs, queries)))
+
+        """
+        await self.submit_job_async(payload=payload, use_latest_api_version=use_latest_api_version)
+        await self.get_job_results_async()
+
+        wait = API_JOB_INITIAL_WAIT
+        while self.job_state != const.API_JOB_DONE_STATE:
+            if self.job_state not in API_JOB_EXPECTED_STATES:
+                raise RuntimeError('Unexpected job state')
+            if self.job_state == const.API_JOB_FAILED_STATE:
+                raise Exception('Job failed')
+
+            await asyncio.sleep(self._get_poll_delay(wait))
+            wait = min(wait * 2, API_JOB_MAX_WAIT)
+            await self.get_job_results_async()
+
+        return True
+
+    @staticmethod
+    async def submit_many_async(jobs, payloads, use_latest_api_version=False) -> bool:
+        """Submit several jobs concurrently.
+
+        Parameters
+        ----------
+        jobs: list of BulkNewsJob
+            Jobs to be submitted.
+        payloads: list
+            Payload for each job, in the same order as jobs.
+
+        Returns
+        -------
+        Boolean : True if all the jobs were submitted. The first Exception raised otherwise.
+
+        """
+        if len(jobs) != len(payloads):
+            raise ValueError('Each job requires a payload')
+
+        await asyncio.gather(*(
+            job.submit_job_async(payload=payload, use_latest_api_version=use_latest_api_version)
+            for job, payload in zip(jobs, payloads)))
+        return True
+
+    @staticmethod
+    async def poll_many_async(jobs) -> bool:
+        """Wait until all the given jobs are completed.
+
+        Pending jobs are checked concurrently on every round, and rounds are
+        spaced with the same delays used by `process_job`, waiting for the
+        longest one among the pending jobs.
+
+        Parameters
+        ----------
+        jobs: list of BulkNewsJob
+            Jobs that have already been submitted.
+
+        Returns
+        -------
+        Boolean : True if all the jobs were completed. An Exception otherwise.
+
+        Raises
+        ------
+        - RuntimeError when a job returns an unexpected state or fails
+
+        """
+        pending = [job for job in jobs if job.job_state != const.API_JOB_DONE_STATE]
+        wait = API_JOB_INITIAL_WAIT
+        while pending:
+            await asyncio.gather(*(job.get_job_results_async() for job in pending))
+            if any(job.job_state not in API_JOB_EXPECTED_STATES for job in pending):
+                raise RuntimeError('Unexpected job state')
+
+            pending = [job for job in pending if job.job_state != const.API_JOB_DONE_STATE]
+            if pending:
+                await asyncio.sleep(max(job._get_poll_delay(wait) for job in pending))
+                wait = min(wait * 2, API_JOB_MAX_WAIT)
+        return True
+
+    @staticmethod
+    def submit_many(jobs, payloads, use_latest_api_version=False) -> bool:
+        """Submit several jobs concurrently and wait for all the submissions to return.
+
+        Blocking wrapper around `submit_many_async`. It can not be called
+        from a running event loop; await `submit_many_async` there instead.
+
+        Examples
+        --------
+        Submitting one analytics job per group dimension
+            >>> jobs = [AnalyticsJob(user_key=my_key) for _ in queries]
+            >>> BulkNewsJob.submit_many(jobs, [q.get_analytics_query() for q in queries])
+            >>> BulkNewsJob.poll_many(jobs)
+
+        """
+        return asyncio.run(BulkNewsJob.submit_many_async(jobs, payloads, use_latest_api_version))
+
+    @staticmethod
+    def poll_many(jobs) -> bool:
+        """Wait until all the given jobs are completed.
+
+        Blocking wrapper around `poll_many_async`. It can not be called from
+        a running event loop; await `poll_many_async` there instead.
+
+        """
+        return asyncio.run(BulkNewsJob.poll_many_async(jobs))
+
+    @staticmethod
+    def process_many_pipelined(jobs, payloads, use_latest_api_version=False, max_workers=4):
+        """Process several jobs in a thread pool, yielding each job as soon as it is completed.
+
+        While the results of a completed job are being converted (e.g. into
+        the DataFrame of an AnalyticsJob) or consumed by the caller, the
+        other jobs keep being polled.
+
+        Parameters
+        ----------
+        jobs: list of BulkNewsJob
+            Jobs to be processed.
+        payloads: list
+            Payload for each job, in the same order as jobs.
+        use_latest_api_version: bool, Optional (Default: False)
+            Submit the jobs to the latest version of the API.
+        max_workers: int, Optional (Default: 4)
+            Maximum number of jobs processed at the same time.
+
+        Yields
+        ------
+        BulkNewsJob : Each job once `process_job` returns for it, in completion
+            order. The Exception raised by `process_job` otherwise.
+
+        Examples
+        --------
+        Consuming analytics results in completion order
+            >>> jobs = [AnalyticsJob(user_key=my_key) for _ in queries]
+            >>> payloads = [q.get_analytics_query() for q in queries]
+            >>> for job in BulkNewsJob.process_many_pipelined(jobs, payloads):
+            ...     print(job.data.head())
+
+        """
+        if len(jobs) != len(payloads):
+            raise ValueError('Each job requires a payload')
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(job.process_job, payload=payload, use_latest_api_version=use_latest_api_version): job
+                for job, payload in zip(jobs, payloads)}
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+
+    def download_file(self, endpoint_url: str, download_path: str, writer=None):
         """Download a file from a job, using the file URL and stores them in download_path.
 
         Parameters
@@ -398,6 +769,9 @@ class BulkNewsJob():
             String containing the URL to download the file from
         download_path: str
             String containing the path where to store the downloaded file
+        writer: _FileWriter, Optional
+            Writer thread used to store the downloaded chunks. If not
+            provided, chunks are written directly by the calling thread.
 
         Returns
         -------
@@ -411,25 +785,36 @@ class BulkNewsJob():
         headers_dict = {
                 'user-key': self.user_key.key
             }
-        response = req.api_send_request(method='GET', endpoint_url=endpoint_url, headers=headers_dict)
+        response = req.api_send_request(method='GET', endpoint_url=endpoint_url, headers=headers_dict, stream=True)
 
         if response.status_code == 200:
-            with open(download_path, 'wb') as download_file_path:
-                download_file_path.write(response.content)
+            if writer is None:
+                with open(download_path, 'wb') as download_file_path:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        download_file_path.write(chunk)
+            else:
+                try:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        writer.write(download_path, chunk)
+                finally:
+                    writer.close_file(download_path)
         else:
             raise RuntimeError(f'API request returned an unexpected HTTP status, with content [{response.text}]')
         return True
 
-    def download_job_files(self, download_path=None):
+    def download_job_files(self, download_path=None, max_workers=4):
         """Download all the files from a job ans stores them in the given download_path.
 
         If no download path is given, the files are stored in a folder with the name of the job_id.
+        Up to max_workers files are downloaded at the same time over the pooled session.
 
         Parameters
         ----------
         download_path: str, Optional
             String containing the path where to store the downloaded files.
             If not provided, the files are stored in a folder named after the job_id. If such folder does not exists, it is created in the current working directory.
+        max_workers: int, Optional (Default: 4)
+            Maximum number of files downloaded concurrently. Use 1 to download them one by one.
 
         Returns
         -------
@@ -438,6 +823,7 @@ class BulkNewsJob():
         Raises
         ------
         - RuntimeError when there are no files available for download
+        - ValueError when several files of the job have the same file name
 
         """
         if download_path is None:
@@ -445,14 +831,74 @@ class BulkNewsJob():
         Path(download_path).mkdir(parents=True, exist_ok=True)
 
         if len(self.files) > 0:
-            for file_uri in self.files:
-                file_name = file_uri.split('/')[-1]
-                local_path = f'{download_path}/{file_name}'
-                self.download_file(file_uri, local_path)
+            file_paths = self._get_file_paths(download_path)
+            writer = _FileWriter()
+            try:
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_paths)))) as executor:
+                    # Consume the iterator so the first failed download is raised here
+                    list(executor.map(self.download_file, file_paths, file_paths.values(), [writer] * len(file_paths)))
+            except BaseException as error:
+                writer.close(error)
+                raise
+            writer.close()
         else:
             raise RuntimeError('No files available for download')
         return True
 
+    async def download_job_files_async(self, download_path=None):
+        """Coroutine version of `download_job_files`.
+
+        All files from the job are downloaded concurrently.
+
+        Parameters
+        ----------
+        download_path: str, Optional
+            String containing the path where to store the downloaded files.
+            If not provided, the files are stored in a folder named after the job_id.
+
+        Returns
+        -------
+        Boolean : True if the files were correctly downloaded. An Exception otherwise.
+
+        Raises
+        ------
+        - RuntimeError when there are no files available for download
+        - ValueError when several files of the job have the same file name
+
+        """
+        if download_path is None:
+            download_path = os.path.join(os.getcwd(), self.job_id)
+        Path(download_path).mkdir(parents=True, exist_ok=True)
+
+        if len(self.files) == 0:
+            raise RuntimeError('No files available for download')
+
+        file_paths = self._get_file_paths(download_path)
+        writer = _FileWriter()
+        try:
+            await asyncio.gather(*(
+                req.run_blocking(self.download_file, file_uri, file_path, writer)
+                for file_uri, file_path in file_paths.items()))
+        except BaseException as error:
+            await req.run_blocking(writer.close, error)
+            raise
+        await req.run_blocking(writer.close)
+        return True
+
+    def _get_file_paths(self, download_path):
+        """Map each file of the job to its local path in download_path.
+
+        Repeated URIs are downloaded once. Different URIs with the same file
+        name are rejected, since they would be written to the same file.
+
+        """
+        file_paths = {}
+        for file_uri in self.files:
+            file_paths[file_uri] = f"{download_path}/{file_uri.rpartition('/')[2]}"
+        if len(set(file_paths.values())) < len(file_paths):
+            raise ValueError('Several job files have the same file name')
+        return file_paths
+
     def get_job_samples(self, num_samples):
         """Obtain the Explain job samples from the Factiva Snapshots API.
         Returns a dataframe of up to 100 sample documents which  includes title and metadata fields.
@@ -478,7 +924,7 @@ class BulkNewsJob():
         samples_url=f'{self.get_endpoint_url()}/{self.job_id}'
         response = req.api_send_request(method='GET', endpoint_url=samples_url, headers=headers_dict, qs_params=s_param)
         if response.status_code == 200:
-            resp_json = response.json()['data']['attributes']['sample']
+            resp_json = req.api_json(response)['data']['attributes']['sample']
             samples = pd.DataFrame(resp_json)
             # print(f'DataFrame size: {samples.shape}')
             # print(f'Columns: {samples.columns}')
@@ -492,11 +938,9 @@ class BulkNewsJob():
 
     def __str__(self, detailed=True, prefix='  |-', root_prefix=''):
         """Create string representation for BulkNews Class."""
-        pprop = self.__dict__.copy()
-        ret_val = str(self.__class__)
-        ret_val += '\n'
+        parts = [get_class_name(self.__class__)]
         if self.job_id == '':
-            ret_val += f'{prefix}<Empty>'
+            parts.append(f'{prefix}<Empty>')
         else:
-            ret_val += '\n'.join(('{}{} = {}'.format(prefix, item, pprop[item]) for item in pprop))
-        return ret_val
+            parts.extend(f'{prefix}{item} = {value}' for item, value in self.__dict__.items() if not item.startswith('_'))
+        return '\n'.join(parts)
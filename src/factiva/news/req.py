@@ -0,0 +1,335 @@
+"""Implement helpers to send requests to the Factiva APIs and read their responses."""
+import asyncio
+import functools
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+
+import requests
+from factiva.core import const, factiva_logger, tools
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+__all__ = ['api_send_request', 'download_file', 'api_json', 'json_dumps', 'json_loads', 'get_session', 'run_blocking']
+
+# Enough pooled connections for the default executor used by the *_async methods
+SESSION_POOL_MAXSIZE = max(32, (os.cpu_count() or 1) * 4)
+
+# Bytes written at a time by download_file
+DOWNLOAD_FILE_CHUNK_SIZE = 1024 * 1024
+
+# Transient errors retried by the session. Only idempotent methods are retried
+SESSION_RETRY_TOTAL = 5
+SESSION_RETRY_BACKOFF_FACTOR = 0.3
+SESSION_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+# GET requests in flight, keyed by request. Values are the Future of the response
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Get the session shared by all the requests sent to the Factiva APIs.
+
+    The session keeps connections alive, so consecutive requests to the same
+    host (e.g. while polling a job) reuse the TCP/TLS connection instead of
+    opening a new one each time. Connection errors and the HTTP statuses in
+    SESSION_RETRY_STATUS_CODES are retried with an exponential backoff for
+    idempotent methods (GET, DELETE), but never for POST requests.
+
+    Returns
+    -------
+    requests.Session created on the first call.
+
+    """
+    global _session  # pylint: disable=global-statement
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retry = Retry(total=SESSION_RETRY_TOTAL,
+                              backoff_factor=SESSION_RETRY_BACKOFF_FACTOR,
+                              status_forcelist=SESSION_RETRY_STATUS_CODES,
+                              raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=4,
+                                      pool_maxsize=SESSION_POOL_MAXSIZE,
+                                      max_retries=retry)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call in the default executor of the running event loop.
+
+    Parameters
+    ----------
+    func: callable
+        Blocking function to execute, usually a method sending an HTTP request.
+    args, kwargs:
+        Arguments passed as they are to `func`.
+
+    Returns
+    -------
+    The value returned by `func`.
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def send_get_request(endpoint_url=const.API_HOST,
+                     headers=None,
+                     qs_params=None,
+                     stream=False):
+    """Send get request."""
+    if (qs_params is not None) and (not isinstance(qs_params, dict)):
+        raise ValueError('Unexpected qs_params value')
+    return get_session().get(endpoint_url,
+                             headers=headers,
+                             params=qs_params,
+                             stream=stream)
+
+
+def send_coalesced_get_request(endpoint_url=const.API_HOST,
+                               headers=None,
+                               qs_params=None):
+    """Send get request, sharing the response with identical requests sent at the same time.
+
+    When several threads request the same URL with the same headers and
+    parameters while a previous identical request is still in flight, only
+    one HTTP request is sent and all of them get the same response, or the
+    same exception.
+
+    """
+    try:
+        key = (endpoint_url,
+               tuple(sorted(headers.items())) if headers else None,
+               tuple(sorted(qs_params.items())) if qs_params else None)
+        hash(key)
+    except (AttributeError, TypeError):
+        return send_get_request(endpoint_url=endpoint_url, headers=headers, qs_params=qs_params)
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        future.set_result(send_get_request(endpoint_url=endpoint_url, headers=headers, qs_params=qs_params))
+    except BaseException as error:
+        # Also on KeyboardInterrupt or SystemExit, so waiters are never left blocked
+        future.set_exception(error)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+    return future.result()
+
+
+def send_post_request(endpoint_url=const.API_HOST, headers=None, payload=None):
+    """Send post request."""
+    if payload is not None:
+        if isinstance(payload, dict):
+            payload_str = json_dumps(payload)
+        elif isinstance(payload, str):
+            payload_str = payload
+        else:
+            raise ValueError('Unexpected payload value')
+        return get_session().post(endpoint_url, headers=headers, data=payload_str)
+
+    return get_session().post(endpoint_url, headers=headers)
+
+
+def api_send_request(method='GET',
+                     endpoint_url=const.API_HOST,
+                     headers=None,
+                     payload=None,
+                     qs_params=None,
+                     stream=False):
+    """Send a generic request to a certain API end point.
+
+    Same contract as `factiva.core.req.api_send_request`, but requests are
+    sent through the shared session returned by `get_session`. Identical
+    GET requests sent concurrently (e.g. several threads polling the same
+    job) are coalesced into a single HTTP request, except when streaming.
+
+    Unlike the core version it is not wrapped with `factiva_logger`, which
+    opens the log file and inspects the call stack on every call. Polling
+    loops send many requests, and the public methods sending them are
+    already logged.
+
+    """
+    if headers is None:
+        raise ValueError('Heders for Factiva requests cannot be empty')
+
+    if not isinstance(headers, dict):
+        raise ValueError('Unexpected headers value')
+
+    try:
+        if method == 'GET' and stream:
+            response = send_get_request(endpoint_url=endpoint_url,
+                                        headers=headers,
+                                        qs_params=qs_params,
+                                        stream=stream)
+
+        elif method == 'GET':
+            response = send_coalesced_get_request(endpoint_url=endpoint_url,
+                                                  headers=headers,
+                                                  qs_params=qs_params)
+
+        elif method == 'POST':
+            response = send_post_request(endpoint_url=endpoint_url,
+                                         headers=headers,
+                                         payload=payload)
+
+        elif method == 'DELETE':
+            response = get_session().delete(endpoint_url, headers=headers)
+
+        else:
+            raise ValueError('Unexpected method value')
+
+    except ValueError:
+        raise
+    except Exception as error:
+        # Transient failures were already retried by the session
+        raise RuntimeError('API Request failed. Unspecified Error.') from error
+
+    return response
+
+
+@factiva_logger
+def download_file(file_url,
+                  headers,
+                  file_name,
+                  file_extension,
+                  to_save_path,
+                  add_timestamp=False,
+                  chunk_size=DOWNLOAD_FILE_CHUNK_SIZE) -> str:
+    """Download a file on a specific path.
+
+    The response body is copied to the file in chunks while it arrives, so
+    big files are never held in memory.
+
+    Parameters
+    ----------
+    file_url : str
+        URL of the file to be downloaded.
+    headers : dict
+        Auth headers
+    file_name : str
+        Name to be used as local filename
+    file_extension : str
+        Extension of the file
+    to_save_path : str
+        Path to be used to store the file
+    add_timestamp : bool, optional
+        Flag to determine if include timestamp info at the filename
+    chunk_size : int, optional
+        Bytes read from the response and written to the file at a time
+
+    Returns
+    -------
+    str
+        Dowloaded file path
+
+    """
+    tools.validate_field_options(file_extension,
+                                 const.API_EXTRACTION_FILE_FORMATS)
+
+    tools.create_path_if_not_exist(to_save_path)
+
+    if add_timestamp:
+        file_name = f'{file_name}-{datetime.now()}'
+
+    response = send_get_request(endpoint_url=file_url,
+                                headers=headers,
+                                stream=True)
+
+    local_file_name = os.path.join(to_save_path,
+                                   f'{file_name}.{file_extension}')
+    response.raw.decode_content = True
+    with open(local_file_name, 'wb') as f:
+        shutil.copyfileobj(response.raw, f, length=chunk_size)
+
+    return local_file_name
+
+
+def json_dumps(obj):
+    """Serialize an object to JSON, using orjson when it is installed.
+
+    Parameters
+    ----------
+    obj:
+        Object to be serialized, usually a request payload dict.
+
+    Returns
+    -------
+    bytes with the JSON document when orjson is used, str otherwise. Both
+    are accepted as a request body.
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. non-str keys, which orjson does not serialize
+            pass
+    return json.dumps(obj)
+
+
+def json_loads(data):
+    """Parse a JSON document, using orjson when it is installed.
+
+    Parameters
+    ----------
+    data: str or bytes
+        JSON document to be parsed.
+
+    Returns
+    -------
+    Python object represented by the document.
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def api_json(response):
+    """Parse the body of an API response as JSON.
+
+    Replaces `response.json()`. When orjson is installed, the raw bytes are
+    parsed directly without decoding them to text first, which is noticeably
+    faster for large analytics results and stream responses.
+
+    Parameters
+    ----------
+    response: requests.Response
+        Response returned by `api_send_request`.
+
+    Returns
+    -------
+    Python object represented by the response body.
+
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
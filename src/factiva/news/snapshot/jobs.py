@@ -1,10 +1,40 @@
 """Implement different helper functions and classes for jobs."""
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+
 import pandas as pd
 
 
 from factiva.core import const
+from factiva.news import req
 from factiva.news.bulknews import BulkNewsJob
 
+# EXTRACTION_ID FORMAT: dj-synhub-extraction-{USER-KEY}-{SNAPSHOT_ID}
+_EXTRACTION_JOB_ID_RE = re.compile(r'^dj-synhub-extraction-([0-9a-z]{32})-([0-9a-z]{10})$', re.IGNORECASE)
+# UPDATE_ID FORMAT: {SNAPSHOT_ID}-{UPDATE_TYPE}-{DATETIME}
+_UPDATE_ID_RE = re.compile(r'^([0-9a-zA-Z]+)-([a-z]+)-(\w+)$')
+_ANALYTICS_COUNT_FIELD = 'count'
+
+# Analytics results cache. Only used when requested with use_cache=True
+ANALYTICS_CACHE_TTL = 24 * 60 * 60
+
+
+def get_analytics_cache_dir() -> Path:
+    """Get the folder where analytics results are cached.
+
+    Taken from the FACTIVA_CACHE_DIR environment variable, or
+    ~/.factiva/analytics_cache when not set.
+
+    """
+    cache_dir = os.getenv('FACTIVA_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir).expanduser() / 'analytics_cache'
+    return Path.home() / '.factiva' / 'analytics_cache'
+
 
 class ExplainJob(BulkNewsJob):
     """Represent the operation of creating an explain from Factiva Snapshots API."""
@@ -61,13 +91,82 @@ class AnalyticsJob(BulkNewsJob):
         """Get job ID."""
         return source['data']['id']
 
+    def get_cache_path(self, payload, use_latest_api_version=False) -> Path:
+        """Get the cache file for the results of a payload.
+
+        The file name is a hash of the user key, the API version and the
+        payload with sorted keys, so equivalent queries share the same file.
+
+        """
+        if isinstance(payload, str):
+            payload = req.json_loads(payload)
+        cache_key = hashlib.blake2b(digest_size=20)
+        cache_key.update(self.user_key.key.encode())
+        cache_key.update(b'latest' if use_latest_api_version else b'default')
+        cache_key.update(json.dumps(payload, sort_keys=True).encode())
+        return get_analytics_cache_dir() / f'{cache_key.hexdigest()}.json'
+
+    def process_job(self, payload=None, use_latest_api_version=False, use_cache=False, cache_ttl=ANALYTICS_CACHE_TTL) -> bool:
+        """Process an analytics job, optionally reusing the results of an identical previous job.
+
+        Parameters
+        ----------
+        payload: dict or str, Optional
+            Contains the analytics query.
+        use_cache: bool, Optional (Default: False)
+            When True, results of a previous job with the same payload and
+            user key are loaded from disk instead of submitting a new job, and
+            new results are stored once the job is done.
+        cache_ttl: int, Optional (Default: ANALYTICS_CACHE_TTL)
+            Seconds a cached result is considered valid.
+
+        Returns
+        -------
+        Boolean : True if the job processing was successful. An Exception
+            otherwise.
+
+        """
+        if not use_cache:
+            return super().process_job(payload, use_latest_api_version)
+
+        cache_path = self.get_cache_path(payload, use_latest_api_version)
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < cache_ttl:
+            # Results are stored as JSON records and go through set_job_data
+            # again, which restores the same column types
+            results = json.loads(cache_path.read_text(encoding='utf-8'))
+            self.set_job_data({'data': {'attributes': {'results': results}}})
+            self.job_state = const.API_JOB_DONE_STATE
+            return True
+
+        super().process_job(payload, use_latest_api_version)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f'{cache_path.name}.tmp')
+        self.data.to_json(tmp_path, orient='records')
+        os.replace(tmp_path, cache_path)
+        return True
+
     def set_job_data(self, source):
-        """Sets job data."""
-        self.data = pd.DataFrame(source['data']['attributes']['results'])
+        """Sets job data.
 
-        for field in const.API_GROUP_DIMENSIONS_FIELDS:
-            if field not in self.data.columns:
-                self.data[field] = f'ALL_{field.upper().strip()}'
+        Counts are stored as int64 and group dimensions as categories, which
+        keeps large results much smaller than plain object columns. Counts
+        with missing values are left as parsed. Period values are kept as
+        returned by the API (e.g. '2018-01').
+
+        """
+        data = pd.DataFrame.from_records(source['data']['attributes']['results'])
+        # All the casts and the missing dimension columns are applied in one
+        # step each, instead of rebuilding the frame once per column
+        column_types = {field: 'category' for field in const.API_GROUP_DIMENSIONS_FIELDS if field in data.columns}
+        if _ANALYTICS_COUNT_FIELD in data.columns and data[_ANALYTICS_COUNT_FIELD].notna().all():
+            column_types[_ANALYTICS_COUNT_FIELD] = 'int64'
+        data = data.astype(column_types)
+
+        missing_dimensions = {field: pd.Categorical([f'ALL_{field.upper().strip()}'] * len(data))
+                              for field in const.API_GROUP_DIMENSIONS_FIELDS if field not in data.columns}
+        if missing_dimensions:
+            data = pd.concat([data, pd.DataFrame(missing_dimensions, index=data.index)], axis=1)
+        self.data = data
 
 
 class ExtractionJob(BulkNewsJob):
@@ -93,15 +192,19 @@ class ExtractionJob(BulkNewsJob):
     # pylint: disable=no-self-use
     def get_job_id(self, source):
         """Obtain Job ID."""
-        return source['data']['id'].split('-')[-1]
+        job_id = source['data']['id']
+        id_match = _EXTRACTION_JOB_ID_RE.match(job_id)
+        if not id_match:
+            raise ValueError(f'Unexpected extraction job id: {job_id}')
+        return id_match.group(2)
 
     def set_job_data(self, source):
         """Set job data."""
-        self.file_format = source['data']['attributes']['format']
-        file_list = source['data']['attributes']['files']
-        self.files = [file_item['uri'] for file_item in file_list]
+        attributes = source['data']['attributes']
+        self.file_format = attributes['format']
+        self.files = [file_item['uri'] for file_item in attributes['files']]
 
-    def process_job(self, payload=None, path=None):
+    def process_job(self, payload=None, path=None, use_latest_api_version=False):
         """Override method from parent class to call the method for downloading the files once the snapshot has been completed.
 
         Overrides method from parent class to call the method for downloading the files once the snapshot has been completed.
@@ -115,10 +218,32 @@ class ExtractionJob(BulkNewsJob):
             String containg the path where to store the snapshots files that are downloaded from the snapshot.
             If no path is given, the files will be stored in a folder named after the snapshot_id in the current working directory.
 
+        use_latest_api_version: bool, Optional (Default: False)
+            Submit the job to the latest version of the API.
+
         """
-        super().process_job(payload)
+        super().process_job(payload, use_latest_api_version)
         self.download_job_files(path)
 
+    async def process_job_async(self, payload=None, path=None, use_latest_api_version=False):
+        """Coroutine version of `process_job`, downloading the files concurrently once the snapshot has been completed.
+
+        Parameters
+        ----------
+        payload: str, Optional
+            String containg the snapshot instance.
+
+        path: str, Optional
+            String containg the path where to store the snapshots files that are downloaded from the snapshot.
+            If no path is given, the files will be stored in a folder named after the snapshot_id in the current working directory.
+
+        use_latest_api_version: bool, Optional (Default: False)
+            Submit the job to the latest version of the API.
+
+        """
+        await super().process_job_async(payload, use_latest_api_version)
+        await self.download_job_files_async(path)
+
 
 class UpdateJob(ExtractionJob):
     """Represent the Snapshot Updates.
@@ -138,6 +263,7 @@ class UpdateJob(ExtractionJob):
     Raises
     ------
     - Exception when fields that are not compatible are provided or when not enough parameters are provided to create the job.
+    - ValueError when update_id does not follow the {SNAPSHOT_ID}-{UPDATE_TYPE}-{DATETIME} format.
 
     """
     update_type = None
@@ -151,9 +277,12 @@ class UpdateJob(ExtractionJob):
             raise Exception('update_id parameter is not compatible with update_type and snapshot id')
 
         if update_id:
+            # Checked before any request, so a malformed id fails without a round trip
+            id_match = _UPDATE_ID_RE.match(update_id)
+            if not id_match:
+                raise ValueError(f'Unexpected update_id format: {update_id}')
             self.job_id = update_id
-            self.update_type = update_id.split('-')[1]
-            self.snapshot_id = update_id.split('-')[0]
+            self.snapshot_id, self.update_type = id_match.group(1, 2)
             self.link = f'{const.API_HOST}{const.API_SNAPSHOTS_BASEPATH}/dj-synhub-extraction-{self.user_key.key.lower()}-{update_id}'
             self.get_job_results()
 
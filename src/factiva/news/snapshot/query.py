@@ -1,7 +1,7 @@
 """Implement query class definition."""
 from factiva.core import const
 from factiva.core.tools import validate_type, validate_field_options
-from factiva.news.bulknews import BulkNewsQuery
+from factiva.news.bulknews import BulkNewsQuery, get_class_name
 
 
 def validate_group_options(by_source, by_dimensions):
@@ -19,6 +19,7 @@ class SnapshotQuery(BulkNewsQuery):
     group_by_source_code = None
     top = 0
     group_dimensions = None
+    _validated = False
 
     # pylint: disable=too-many-arguments
     def __init__(self,
@@ -74,6 +75,14 @@ class SnapshotQuery(BulkNewsQuery):
         else:
             raise ValueError('Top value is not valid')
 
+        self._validated = True
+
+    def __setattr__(self, name, value):
+        """Set an attribute, flagging frequency and date_field for validation when they change."""
+        super().__setattr__(name, value)
+        if name in ('frequency', 'date_field'):
+            self.__dict__['_validated'] = False
+
     def get_explain_query(self):
         """Obtain Base Query."""
         query_dict = self.get_base_query()
@@ -83,12 +92,14 @@ class SnapshotQuery(BulkNewsQuery):
         """Obtain analytics Query."""
         query_dict = self.get_base_query()
 
-        self.frequency = self.frequency.upper().strip()
-        validate_field_options(self.frequency, const.API_DATETIME_PERIODS)
-        query_dict["query"].update({"frequency": self.frequency})
+        if not self._validated:
+            self.frequency = self.frequency.upper().strip()
+            validate_field_options(self.frequency, const.API_DATETIME_PERIODS)
+            self.date_field = self.date_field.lower().strip()
+            validate_field_options(self.date_field, const.API_DATETIME_FIELDS)
+            self._validated = True
 
-        self.date_field = self.date_field.lower().strip()
-        validate_field_options(self.date_field, const.API_DATETIME_FIELDS)
+        query_dict["query"].update({"frequency": self.frequency})
         query_dict["query"].update({"date_field": self.date_field})
 
         validate_group_options(self.group_by_source_code, self.group_dimensions)
@@ -129,15 +140,12 @@ class SnapshotQuery(BulkNewsQuery):
 
     def __str__(self, detailed=False, prefix='  |-', root_prefix=''):
         """Create string representation for Query Class."""
-        pprop = self.__dict__.copy()
-
-        ret_val = f'{root_prefix}{str(self.__class__)}\n'
-        if detailed:
-            ret_val += '\n'.join(('{}{} = {}'.format(prefix, item, pprop[item]) for item in pprop))
-        else:
-            ret_val += f'{prefix}where: '
-            ret_val += (self.where[:77] + '...') if len(self.where) > 80 else self.where
-            ret_val += f'\n{prefix}...'
-            del pprop['where']
-            ret_val += '\n'.join(('{}{} = {}'.format(prefix, item, pprop[item]) for item in pprop))
-        return ret_val
+        parts = [f'{root_prefix}{get_class_name(self.__class__)}\n']
+        hidden = None
+        if not detailed:
+            where = (self.where[:77] + '...') if len(self.where) > 80 else self.where
+            parts.append(f'{prefix}where: {where}\n{prefix}...')
+            hidden = 'where'
+        parts.append('\n'.join(f'{prefix}{item} = {value}' for item, value in self.__dict__.items()
+                                if item != hidden and not item.startswith('_')))
+        return ''.join(parts)
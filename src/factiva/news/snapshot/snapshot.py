@@ -1,10 +1,16 @@
 """Represent a Factiva Snapshot Class."""
 from factiva.core import const, factiva_logger, get_factiva_logger
-from factiva.news.bulknews import BulkNewsBase
+from factiva.news.bulknews import BulkNewsBase, get_class_name
 
 from .jobs import AnalyticsJob, ExplainJob, ExtractionJob, UpdateJob
 from .query import SnapshotQuery
 
+log = get_factiva_logger()
+
+# Printed on their own by Snapshot.__str__, before the remaining properties
+_STR_DETAILED_PROPERTIES = frozenset(('user_key', 'query', 'last_explain_job', 'last_analytics_job', 'last_extraction_job'))
+
+
 class Snapshot(BulkNewsBase):
     """Represent a Factiva Snapshot Class.
 
@@ -83,7 +89,8 @@ class Snapshot(BulkNewsBase):
 
         self.last_explain_job = ExplainJob(user_key=self.user_key)
         self.last_analytics_job = AnalyticsJob(user_key=self.user_key)
-        self.log = get_factiva_logger()
+        self.file_list = []
+        self.log = log
 
         if query and snapshot_id:
             raise Exception("The query and snapshot_id parameters cannot be set simultaneously")
@@ -220,7 +227,7 @@ class Snapshot(BulkNewsBase):
         return self.last_analytics_job.get_job_results()
 
     @factiva_logger
-    def process_analytics(self):
+    def process_analytics(self, use_cache=False):
         """Submit an Analytics job to the Factiva Snapshots API.
 
         Submits an Analytics job to the Factiva Snapshots API, using the same
@@ -228,6 +235,13 @@ class Snapshot(BulkNewsBase):
         its status change to `JOB_STATE_DONE`. Finally, retrieves and stores
         the results in the property `last_analytics_job`.
 
+        Parameters
+        ----------
+        use_cache: bool, optional
+            When True, results of a previous identical analytics job are
+            loaded from the local cache (see FACTIVA_CACHE_DIR) instead of
+            submitting a new job. (Default is False)
+
         Returns
         -------
         Boolean : True if the analytics processing was successful. An Exception
@@ -260,7 +274,7 @@ class Snapshot(BulkNewsBase):
         if(isinstance(self.query.group_by_source_code, bool)):
             use_latest_api_version = False
 
-        return self.last_analytics_job.process_job(self.query.get_analytics_query(), use_latest_api_version)
+        return self.last_analytics_job.process_job(self.query.get_analytics_query(), use_latest_api_version, use_cache=use_cache)
 
     @factiva_logger
     def submit_extraction_job(self):
@@ -358,6 +372,33 @@ class Snapshot(BulkNewsBase):
         """
         return self.last_extraction_job.process_job(self.query.get_extraction_query(), download_path)
 
+    async def process_extraction_async(self, download_path=None):
+        """Coroutine version of `process_extraction`.
+
+        Allows running several Snapshot extractions concurrently from a single
+        event loop, instead of dedicating a thread to each one of them.
+
+        Parameters
+        ----------
+        download_path: str, optional
+            String containing the file path on where to store the files. If not
+            provided, files are stored in a folder with the same name as the
+            snapshot ID.
+
+        Returns
+        -------
+        Boolean : True if the extraction processing was successful. An Exception
+            otherwise.
+
+        Examples
+        --------
+        Process two extraction jobs concurrently.
+            >>> snapshots = [Snapshot(user_key=my_key, query=q) for q in (query_a, query_b)]
+            >>> await asyncio.gather(*(s.process_extraction_async() for s in snapshots))
+
+        """
+        return await self.last_extraction_job.process_job_async(self.query.get_extraction_query(), download_path)
+
     @factiva_logger
     def submit_update_job(self, update_type):
         """Submit an Update Job to the Factiva Snapshots API.
@@ -479,34 +520,14 @@ class Snapshot(BulkNewsBase):
 
     def __str__(self, detailed=True, prefix='  |-', root_prefix=''):
         """Create string representation for Snapshot Class."""
-        pprop = self.__dict__.copy()
         child_prefix = '  |    |-'
-        ret_val = str(self.__class__) + '\n'
-
-        ret_val += f'{prefix}user_key: '
-        ret_val += self.user_key.__str__()
-        del pprop['user_key']
-        ret_val += '\n'
-
-        ret_val += f'{prefix}query: '
-        ret_val += self.query.__str__(detailed=False, prefix=child_prefix)
-        del pprop['query']
-        ret_val += '\n'
-
-        ret_val += f'{prefix}last_explain_job: '
-        ret_val += self.last_explain_job.__str__(detailed=False, prefix=child_prefix)
-        del pprop['last_explain_job']
-        ret_val += '\n'
-
-        ret_val += f'{prefix}last_analytics_job: '
-        ret_val += self.last_analytics_job.__str__(detailed=False, prefix=child_prefix)
-        del pprop['last_analytics_job']
-        ret_val += '\n'
-
-        ret_val += f'{prefix}last_extraction_job: '
-        ret_val += self.last_extraction_job.__str__(detailed=False, prefix=child_prefix)
-        del pprop['last_extraction_job']
-        ret_val += '\n'
-
-        ret_val += '\n'.join(('{}{} = {}'.format(prefix, item, pprop[item]) for item in pprop))
-        return ret_val
+        parts = [get_class_name(self.__class__)]
+
+        parts.append(f'{prefix}user_key: {self.user_key.__str__()}')
+        parts.append(f"{prefix}query: {self.query.__str__(detailed=False, prefix=child_prefix)}")
+        parts.append(f"{prefix}last_explain_job: {self.last_explain_job.__str__(detailed=False, prefix=child_prefix)}")
+        parts.append(f"{prefix}last_analytics_job: {self.last_analytics_job.__str__(detailed=False, prefix=child_prefix)}")
+        parts.append(f"{prefix}last_extraction_job: {self.last_extraction_job.__str__(detailed=False, prefix=child_prefix)}")
+        parts.append('\n'.join(('{}{} = {}'.format(prefix, item, value)
+                                 for item, value in self.__dict__.items() if item not in _STR_DETAILED_PROPERTIES)))
+        return '\n'.join(parts)
@@ -1,11 +1,37 @@
 """Implement Listener class."""
-import json
+import os
 import time
 from threading import Thread
 
-from factiva.core import const, factiva_logger, get_factiva_logger, req
+from factiva.core import const, factiva_logger, get_factiva_logger
 from factiva.core.tools import load_environment_value
-from google.api_core.exceptions import GoogleAPICallError, NotFound
+from factiva.news import req
+from google.api_core.exceptions import (GoogleAPICallError, NotFound,
+                                         PermissionDenied, Unauthenticated)
+from google.cloud.pubsub_v1 import SubscriberClient
+from google.oauth2 import service_account
+
+log = get_factiva_logger()
+
+UNDEFINED_SUBSCRIPTION_MESSAGE = 'No subscription specified. You must specify the subscription ID'
+PUBSUB_CLIENT_ERROR_MESSAGE = 'Something unexpected happened while creating Pubsub client'
+
+# Seconds an account info response is reused before the API is queried again
+ACCOUNT_INFO_CACHE_TTL = 30
+# Seconds the Pubsub streaming credentials are reused before they are fetched again
+STREAMING_CREDENTIALS_CACHE_TTL = 300
+
+
+def get_cache_ttl(env_name, default) -> float:
+    """Get a cache TTL in seconds from an environment variable, or the default when it is unset or not a number."""
+    value = os.getenv(env_name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        log.warning(f'Invalid value for {env_name}: {value}. Using {default} seconds instead')
+        return default
 
 
 def default_callback(message, subscription_id):
@@ -71,6 +97,10 @@ class Listener:
     """
 
     _check_exceeds_thread = None
+    _request_context = None
+    _account_info_cache = {}
+    # Streaming credentials by user key, as (time fetched, credentials dict, service account credentials)
+    _credentials_cache = {}
     FIRST_OBJECT = 0
 
     def __init__(self, subscription_id=None, stream_user=None):
@@ -79,7 +109,7 @@ class Listener:
             try:
                 subscription_id = load_environment_value('FACTIVA_STREAM_SUBSCRIPTION_ID')
             except Exception:
-                raise const.UNDEFINED_SUBSCRIPTION_ERROR
+                raise ValueError(UNDEFINED_SUBSCRIPTION_MESSAGE)
 
         if not stream_user:
             raise ValueError('Undefined stream_user')
@@ -88,35 +118,114 @@ class Listener:
         self.subscription_id = subscription_id
         self.is_consuming = True
         self.limit_msg = None
-        self.log= get_factiva_logger()
+        self.log = log
 
     @property
     def stream_id_uri(self):
         """Property for retrieving the stream id uri."""
-        host = self.user_key.get_uri_context()
-        stream_id = '-'.join(self.subscription_id.split("-")[:-2])
+        host = self._get_request_context()[1]
+        stream_id = self.subscription_id.rpartition('-')[0].rpartition('-')[0]
         return f'{host}/streams/{stream_id}'
 
+    def _get_request_context(self):
+        """Get the authentication headers and the API host of the stream user.
+
+        Both are obtained once and reused by the status checks, which run
+        periodically while the listener is consuming.
+
+        Returns
+        -------
+        Tuple with the headers dict and the host uri
+
+        """
+        if self._request_context is None:
+            headers = self.user_key.get_authentication_headers()
+            self._request_context = (headers, self.user_key.get_uri_context())
+        return self._request_context
+
+    def _get_streaming_credentials(self, force=False):
+        """Get the Pubsub streaming credentials of the stream user.
+
+        Works as `StreamUser.fetch_credentials`, but the credentials and the
+        service account credentials parsed from them are shared by the
+        listeners of the same user key for STREAMING_CREDENTIALS_CACHE_TTL
+        seconds (env FACTIVA_CREDENTIALS_TTL).
+
+        Parameters
+        ----------
+        force: bool, Optional
+            Fetch the credentials even if the cached ones are still fresh.
+
+        Returns
+        -------
+        Tuple with the credentials dict and the service account credentials
+
+        Raises
+        ------
+        RuntimeError: When the service account credentials cannot be created
+
+        """
+        now = time.monotonic()
+        cached = self._credentials_cache.get(self.user_key.key)
+        if not force and cached is not None and now - cached[0] < get_cache_ttl('FACTIVA_CREDENTIALS_TTL', STREAMING_CREDENTIALS_CACHE_TTL):
+            return cached[1], cached[2]
+
+        streaming_credentials = self.user_key.fetch_credentials()
+        try:
+            credentials = service_account.Credentials.from_service_account_info(streaming_credentials)
+        except Exception:
+            raise RuntimeError(PUBSUB_CLIENT_ERROR_MESSAGE)
+        Listener._credentials_cache[self.user_key.key] = (now, streaming_credentials, credentials)
+        return streaming_credentials, credentials
+
+    def _get_client_subscription(self, force=False):
+        """Create a Pubsub subscriber client with the cached streaming credentials.
+
+        Raises
+        ------
+        RuntimeError: When the Pubsub client cannot be created
+
+        """
+        credentials = self._get_streaming_credentials(force=force)[1]
+        try:
+            return SubscriberClient(credentials=credentials)
+        except Exception:
+            raise RuntimeError(PUBSUB_CLIENT_ERROR_MESSAGE)
+
     @factiva_logger
-    def _check_account_status(self):
+    def _check_account_status(self, force=False):
         """Check the account status for max allowed extracts done.
 
+        The account info response is shared by the listeners of the same user
+        key for ACCOUNT_INFO_CACHE_TTL seconds (env FACTIVA_INFO_TTL).
+
+        Parameters
+        ----------
+        force: bool, Optional
+            Query the API even if a cached response is still fresh.
+
         Raises
         ------
         RuntimeError: When HTTP API Response is unexpected
 
         """
         # TODO: Implement using UserKey.get_stats()
-        host = self.user_key.get_uri_context()
-        headers = self.user_key.get_authentication_headers()
-        limits_uri = f'{host}/accounts/{self.user_key.user_key}'
+        now = time.monotonic()
+        cached = self._account_info_cache.get(self.user_key.key)
+        if not force and cached is not None and now - cached[0] < get_cache_ttl('FACTIVA_INFO_TTL', ACCOUNT_INFO_CACHE_TTL):
+            self.limit_msg = cached[1]['data']['attributes']['max_allowed_extracts']
+            return
+
+        headers, host = self._get_request_context()
+        limits_uri = f'{host}/accounts/{self.user_key.key}'
         limit_response = req.api_send_request(
             method='GET',
             endpoint_url=limits_uri,
             headers=headers
             )
         if limit_response.status_code == 200:
-            limit_response = limit_response.json()
+            limit_response = req.api_json(limit_response)
+            Listener._account_info_cache[self.user_key.key] = (now, limit_response)
             self.limit_msg = limit_response['data']['attributes']['max_allowed_extracts']
         else:
             raise RuntimeError(
@@ -138,14 +247,13 @@ class Listener:
         RuntimeError: When HTTP API Response is unexpected
 
         """
-        headers = self.user_key.get_authentication_headers()
         response = req.api_send_request(
             method='GET',
             endpoint_url=self.stream_id_uri,
-            headers=headers
+            headers=self._get_request_context()[0]
             )
         if response.status_code == 200:
-            response = response.json()
+            response = req.api_json(response)
             job_status = response['data']['attributes']['job_status']
             if job_status == const.DOC_COUNT_EXCEEDED:
                 self._check_account_status()
@@ -227,11 +335,12 @@ class Listener:
         pubsub_messages = pubsub_client.pull(request=pubsub_request)
         if pubsub_messages and pubsub_messages.received_messages:
             for message in pubsub_messages.received_messages:
-                pubsub_message = json.loads(message.message.data)
+                pubsub_message = req.json_loads(message.message.data)
+                news_item = pubsub_message['data'][self.FIRST_OBJECT]
                 self.log.info("Received news message with ID: {}".format(
-                    pubsub_message['data'][self.FIRST_OBJECT]['id'])
+                    news_item['id'])
                 )
-                news_message = pubsub_message['data'][self.FIRST_OBJECT]['attributes']
+                news_message = news_item['attributes']
                 callback_result = callback(
                     news_message,
                     self.subscription_id
@@ -283,10 +392,10 @@ class Listener:
         if not maximum_messages:
             raise ValueError('undefined maximum messages to proceed')
 
-        pubsub_client = self.user_key.get_client_subscription()
+        pubsub_client = self._get_client_subscription()
         self.check_exceeded_thread()
 
-        streaming_credentials = self.user_key.fetch_credentials()
+        streaming_credentials = self._get_streaming_credentials()[0]
         subscription_path = pubsub_client.subscription_path(
             streaming_credentials['project_id'],
             self.subscription_id
@@ -335,7 +444,9 @@ class Listener:
                     '''
                     )
                 time.sleep(const.PUBSUB_MESSAGES_WAIT_SPACING)
-                pubsub_client = self.user_key.get_client_subscription()
+                pubsub_client = self._get_client_subscription(
+                    force=isinstance(google_error, (PermissionDenied, Unauthenticated))
+                    )
 
         self.is_consuming = False
 
@@ -356,20 +467,21 @@ class Listener:
 
         """
         def ack_message_and_callback(message):
-            pubsub_message = json.loads(message.data)
+            pubsub_message = req.json_loads(message.data)
+            news_item = pubsub_message['data'][self.FIRST_OBJECT]
             self.log.info("Received news message with ID: {}".format(
-                pubsub_message['data'][self.FIRST_OBJECT]['id']
+                news_item['id']
                 )
             )
-            news_message = pubsub_message['data'][self.FIRST_OBJECT]['attributes']
+            news_message = news_item['attributes']
             callback(news_message, self.subscription_id)
             if ack_enabled:
                 message.ack()
 
-        pubsub_client = self.user_key.get_client_subscription()
+        pubsub_client = self._get_client_subscription()
         self.check_exceeded_thread()
 
-        streaming_credentials = self.user_key.fetch_credentials()
+        streaming_credentials = self._get_streaming_credentials()[0]
         subscription_path = pubsub_client.subscription_path(
             streaming_credentials['project_id'],
             self.subscription_id
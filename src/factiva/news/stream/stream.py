@@ -1,10 +1,16 @@
 """Implement Stream Class definition."""
 from typing import List
 
-from factiva.core import StreamResponse, StreamUser, const, req, get_factiva_logger, factiva_logger
+from factiva.core import StreamResponse, StreamUser, const, get_factiva_logger, factiva_logger
+from factiva.news import req
 from factiva.news.bulknews import BulkNewsQuery
 
-from .subscription import Subscription
+from .subscription import UNDEFINED_STREAM_ID_MESSAGE, Subscription
+
+log = get_factiva_logger()
+
+INVALID_SUBSCRIPTION_ID_MESSAGE = 'Invalid subscription id'
+UNEXPECTED_HTTP_STATUS_MESSAGE = 'API Request returned an unexpected HTTP status'
 
 
 class Stream:
@@ -67,6 +73,8 @@ class Stream:
     listener = None
     subscriptions = dict()
 
+    __API_ENDPOINT_STREAMS = f'{const.API_HOST}{const.API_STREAMS_BASEPATH}'
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -81,14 +89,17 @@ class Stream:
             raise ValueError(
                 'Not allowed stream id with query or snapshot'
             )
-        self.log= get_factiva_logger()
+        self.log = log
         self.stream_id = stream_id
         self.snapshot_id = snapshot_id
+        self.subscriptions = dict()
         self.query = BulkNewsQuery(query)
         self.stream_user = user_key if isinstance(
             user_key, StreamUser) else StreamUser(user_key, user_stats)
         if not self.stream_user:
             raise RuntimeError('Undefined Stream User')
+        self._auth_headers = {'user-key': self.stream_user.key}
+        self._json_headers = {'user-key': self.stream_user.key, 'content-type': 'application/json'}
 
         if stream_id:
             self.set_all_subscriptions()
@@ -96,7 +107,7 @@ class Stream:
     @property
     def stream_url(self) -> str:
         """List Stream's URL address."""
-        return f'{const.API_HOST}{const.API_STREAMS_BASEPATH}'
+        return self.__API_ENDPOINT_STREAMS
 
     @property
     def all_subscriptions(self) -> List[str]:
@@ -133,13 +144,12 @@ class Stream:
         RuntimeError: when exists an unexpected HTTP error
         """
 
-        headers = {'user-key': self.stream_user.key}
         response = req.api_send_request(method='GET',
                                         endpoint_url=self.stream_url,
-                                        headers=headers)
+                                        headers=self._auth_headers)
         if response.status_code == 200:
             try:
-                response_data = response.json()
+                response_data = req.api_json(response)
                 return [
                     StreamResponse(data=stream,
                                    links=stream.get('links', None))
@@ -169,22 +179,34 @@ class Stream:
 
         """
         if not self.stream_id:
-            raise const.UNDEFINED_STREAM_ID_ERROR
+            raise ValueError(UNDEFINED_STREAM_ID_MESSAGE)
         uri = '{}/{}'.format(self.stream_url, self.stream_id)
-        headers = {
-                'user-key': self.stream_user.key
-            }
         response = req.api_send_request(
             method='GET',
             endpoint_url=uri,
-            headers=headers
+            headers=self._auth_headers
         )
         if response.status_code == 200:
-            response = response.json()
+            response = req.api_json(response)
             return StreamResponse(data=response['data'], links=response.get('links', None))
 
         raise RuntimeError(response.text)
 
+    async def get_info_async(self) -> StreamResponse:
+        """Coroutine version of `get_info`.
+
+        The request runs in the default executor, so the info of several
+        streams can be fetched concurrently.
+
+        Examples
+        --------
+        Querying a list of streams at once
+            >>> streams = [Stream(stream_id=s_id) for s_id in stream_ids]
+            >>> infos = await asyncio.gather(*(s.get_info_async() for s in streams))
+
+        """
+        return await req.run_blocking(self.get_info)
+
     @factiva_logger
     def delete(self) -> StreamResponse:
         """Delete a stream.
@@ -203,26 +225,22 @@ class Stream:
 
         """
         if not self.stream_id:
-            raise const.UNDEFINED_STREAM_ID_ERROR
+            raise ValueError(UNDEFINED_STREAM_ID_MESSAGE)
 
         uri = f'{self.stream_url}/{self.stream_id}'
-        headers = {
-                'user-key': self.stream_user.key,
-                'content-type': 'application/json'
-            }
         response = req.api_send_request(
             method='DELETE',
             endpoint_url=uri,
-            headers=headers,
+            headers=self._json_headers,
         )
         if response.status_code == 200:
-            response = response.json()
+            response = req.api_json(response)
             return StreamResponse(data=response['data'], links=response.get('links', None))
 
         if response == 404:
             raise RuntimeError('The Stream does not exist')
 
-        raise const.UNEXPECTED_HTTP_ERROR
+        raise RuntimeError(UNEXPECTED_HTTP_STATUS_MESSAGE)
 
     @factiva_logger
     def create(self) -> StreamResponse:
@@ -265,11 +283,8 @@ class Stream:
         """
         try:
             new_subscription = Subscription(stream_id=self.stream_id)
-            headers = {
-                'user-key': self.stream_user.key
-            }
             new_subscription.create(
-                headers=headers
+                headers=self._auth_headers
             )
             new_subscription.create_listener(self.stream_user)
             self.subscriptions[new_subscription.id] = new_subscription
@@ -304,10 +319,10 @@ class Stream:
 
         """
         if sus_id not in self.subscriptions:
-            raise const.INVALID_SUBSCRIPTION_ID_ERROR
+            raise ValueError(INVALID_SUBSCRIPTION_ID_MESSAGE)
         try:
             if self.subscriptions[sus_id].delete(
-                headers={'user-key': self.stream_user.key}
+                headers=self._auth_headers
             ):
                 del self.subscriptions[sus_id]
                 return True
@@ -319,7 +334,10 @@ class Stream:
     def create_default_subscription(self, response):
         """Create the default subscriptions at initialization.
 
-        Adds the subscriptions to subscriptions dict
+        Syncs the subscriptions dict with the subscriptions in the response.
+        Subscriptions that are already known are kept as they are (along
+        with their listener), only new ones are created and the ones no
+        longer in the response are removed.
 
         Parameters
         ----------
@@ -328,13 +346,20 @@ class Stream:
             which exists inside the stream
 
         """
-        for subscription in response['data']['relationships']['subscriptions']['data']:
-            subscription_obj = Subscription(
+        resp_subscriptions = response['data']['relationships']['subscriptions']['data']
+        resp_ids = {subscription['id'] for subscription in resp_subscriptions}
+        for sub_id in [sub_id for sub_id in self.subscriptions if sub_id not in resp_ids]:
+            del self.subscriptions[sub_id]
+
+        for subscription in resp_subscriptions:
+            if subscription['id'] in self.subscriptions:
+                continue
+            subscription_obj = Subscription._from_trusted(
                 id=subscription['id'],
                 stream_id=self.stream_id,
                 subscription_type=subscription['type'],
+                user=self.stream_user,
                 )
-            subscription_obj.create_listener(self.stream_user)
             self.subscriptions[subscription_obj.id] = subscription_obj
 
     @factiva_logger
@@ -351,21 +376,18 @@ class Stream:
 
         """
         if not self.stream_id:
-            raise const.UNDEFINED_STREAM_ID_ERROR
+            raise ValueError(UNDEFINED_STREAM_ID_MESSAGE)
         uri = '{}/{}'.format(self.stream_url, self.stream_id)
-        headers = {
-                'user-key': self.stream_user.key
-            }
         response = req.api_send_request(
             method='GET',
             endpoint_url=uri,
-            headers=headers
+            headers=self._auth_headers
         )
         if response.status_code == 200:
-            response = response.json()
+            response = req.api_json(response)
             self.create_default_subscription(response)
         else:
-            raise const.UNEXPECTED_HTTP_ERROR
+            raise RuntimeError(UNEXPECTED_HTTP_STATUS_MESSAGE)
 
     def consume_messages(
         self,
@@ -397,7 +419,7 @@ class Stream:
 
         """
         if subscription_id not in self.subscriptions:
-            raise const.INVALID_SUBSCRIPTION_ID_ERROR
+            raise ValueError(INVALID_SUBSCRIPTION_ID_MESSAGE)
         self.subscriptions[subscription_id].consume_messages(
             callback=callback,
             maximum_messages=maximum_messages,
@@ -428,7 +450,7 @@ class Stream:
 
         """
         if subscription_id not in self.subscriptions:
-            raise const.INVALID_SUBSCRIPTION_ID_ERROR
+            raise ValueError(INVALID_SUBSCRIPTION_ID_MESSAGE)
         self.subscriptions[subscription_id].consume_async_messages(
             callback=callback,
             ack_enabled=ack_enabled,
@@ -451,24 +473,21 @@ class Stream:
         if not self.snapshot_id:
             raise ValueError('create fails: snaphot_id undefined')
 
-        headers = {
-                'user-key': self.stream_user.key,
-                'content-type': 'application/json'
-            }
         uri = f'{const.API_HOST}{const.API_SNAPSHOTS_BASEPATH}/{self.snapshot_id}/streams'
         response = req.api_send_request(
             method='POST',
             endpoint_url=uri,
-            headers=headers,
+            headers=self._json_headers,
         )
         if response.status_code == 201:
-            response = response.json()
-            self.stream_id = response['data']['id']
+            response = req.api_json(response)
+            data = response['data']
+            self.stream_id = data['id']
             self.create_default_subscription(response)
 
-            return StreamResponse(data=response['data'], links=response.get('links', None))
+            return StreamResponse(data=data, links=response.get('links', None))
 
-        raise const.UNEXPECTED_HTTP_ERROR
+        raise RuntimeError(UNEXPECTED_HTTP_STATUS_MESSAGE)
 
     def _create_by_query(self) -> StreamResponse:
         """Create by query that allows a user to create a stream subscription using a query.
@@ -495,22 +514,19 @@ class Stream:
                 }
             }
 
-        headers = {
-                'user-key': self.stream_user.key,
-                'content-type': 'application/json'
-            }
         response = req.api_send_request(
                 method='POST',
                 endpoint_url=self.stream_url,
-                headers=headers,
+                headers=self._json_headers,
                 payload=streams_query,
             )
 
         if response.status_code == 201:
-            response = response.json()
-            self.stream_id = response['data']['id']
+            response = req.api_json(response)
+            data = response['data']
+            self.stream_id = data['id']
             self.create_default_subscription(response)
 
-            return StreamResponse(data=response['data'], links=response.get('links', None))
+            return StreamResponse(data=data, links=response.get('links', None))
 
-        raise const.UNEXPECTED_HTTP_ERROR
+        raise RuntimeError(UNEXPECTED_HTTP_STATUS_MESSAGE)
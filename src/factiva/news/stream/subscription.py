@@ -1,10 +1,15 @@
 """Implement Subscription class."""
 from factiva.core import (StreamUser, UserKey, const, factiva_logger,
-                          get_factiva_logger, req)
+                          get_factiva_logger)
 from factiva.core.tools import load_environment_value
+from factiva.news import req
 
 from .listener import Listener
 
+log = get_factiva_logger()
+
+UNDEFINED_STREAM_ID_MESSAGE = 'Undefined stream id'
+
 
 class Subscription:
     """Represent a Subscription inside a stream.
@@ -38,10 +43,8 @@ class Subscription:
     """
 
     SUBSCRIPTION_IDX = 0
-    id = None
-    stream_id = None
-    subscription_type = None
-    listener = None
+    # A stream can hold many subscriptions; slots keep each one small
+    __slots__ = ('url', 'stream_id', 'id', 'subscription_type', 'listener', 'log')
 
     def __init__(self, stream_id=None, id=None, subscription_type=None):
         """Instantiate listener class constructor."""
@@ -49,14 +52,33 @@ class Subscription:
             try:
                 stream_id = load_environment_value('FACTIVA_STREAM_SUBSCRIPTION_ID')
             except Exception:
-                raise const.UNDEFINED_STREAM_ID_ERROR
+                raise ValueError(UNDEFINED_STREAM_ID_MESSAGE)
 
+        self._set_fields(stream_id, id, subscription_type)
+
+    def _set_fields(self, stream_id, id, subscription_type):
+        """Set the subscription fields, shared by the constructor and `_from_trusted`."""
+        # pylint: disable=invalid-name,redefined-builtin
         self.url = f'{const.API_HOST}{const.API_STREAMS_BASEPATH}'
         self.stream_id = stream_id
-        # pylint: disable=invalid-name
         self.id = id
         self.subscription_type = subscription_type
-        self.log= get_factiva_logger()
+        self.listener = None
+        self.log = log
+
+    @classmethod
+    def _from_trusted(cls, id, stream_id, subscription_type, user):
+        """Create a subscription with its listener from values already validated by the caller.
+
+        Used by Stream when syncing its subscriptions, so the stream id
+        lookup and user type checks are skipped for each one.
+
+        """
+        # pylint: disable=invalid-name,redefined-builtin
+        subscription = cls.__new__(cls)
+        subscription._set_fields(stream_id, id, subscription_type)
+        subscription.listener = Listener(subscription_id=id, stream_user=user)
+        return subscription
 
     def __repr__(self):
         """Create string representation for Subscription Class."""
@@ -128,7 +150,7 @@ class Subscription:
             headers=headers
             )
         if response.status_code == 201:
-            response = response.json()
+            response = req.api_json(response)
             data = response['data']
             self.id = data[self.SUBSCRIPTION_IDX]['id']
             self.subscription_type = data[self.SUBSCRIPTION_IDX]['type']
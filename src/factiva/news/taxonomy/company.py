@@ -1,11 +1,15 @@
-from factiva.core import (UserKey, factiva_logger, get_factiva_logger, req,
-                          tools)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from factiva.core import UserKey, factiva_logger, get_factiva_logger, tools
 from factiva.core.const import (API_COMPANIES_IDENTIFIER_TYPE, API_HOST,
                                 API_SNAPSHOTS_COMPANIES_BASEPATH,
                                 API_SNAPSHOTS_COMPANIES_PIT,
                                 API_SNAPSHOTS_TAXONOMY_BASEPATH,
                                 DOWNLOAD_DEFAULT_FOLDER,
                                 TICKER_COMPANY_IDENTIFIER)
+from factiva.news import req
+
+log = get_factiva_logger()
 
 
 class Company():
@@ -33,11 +37,13 @@ class Company():
     __TICKER_COMPANY_IDENTIFIER_NAME = 'ticker_exchange'
 
     user_key=None
+    _enabled_identifier_names = None
     
     def __init__(self, user_key=None):
         """Class initializar"""
         self.user_key = UserKey.create_user_key(user_key, True)
-        self.log= get_factiva_logger()
+        self._auth_headers = {'user-key': self.user_key.key}
+        self.log = log
 
     @factiva_logger
     def validate_point_time_request(self, identifier):
@@ -62,10 +68,10 @@ class Company():
         if (identifier == TICKER_COMPANY_IDENTIFIER):
             identifier = self.__TICKER_COMPANY_IDENTIFIER_NAME
 
-        identifier_description = list(
-            filter(lambda company: company['name'] == identifier,
-                   self.user_key.enabled_company_identifiers))
-        if (not len(identifier_description)):
+        if self._enabled_identifier_names is None:
+            self._enabled_identifier_names = frozenset(
+                company['name'] for company in self.user_key.enabled_company_identifiers)
+        if identifier not in self._enabled_identifier_names:
             raise ValueError('User is not allowed to perform this operation')
 
     @factiva_logger
@@ -74,7 +80,8 @@ class Company():
                                    file_name,
                                    file_format,
                                    to_save_path=None,
-                                   add_timestamp=False) -> str:
+                                   add_timestamp=False,
+                                   chunk_size=req.DOWNLOAD_FILE_CHUNK_SIZE) -> str:
         """Returns a file with the historical and current identifiers for each category and news coded companies.
 
         Parameters
@@ -89,6 +96,8 @@ class Company():
             Path to be used to store the file
         add_timestamp : bool, optional
             Flag to determine if include timestamp info at the filename
+        chunk_size : int, optional
+            Bytes written to the file at a time while downloading
 
         Returns
         -------
@@ -106,12 +115,11 @@ class Company():
         if (to_save_path is None):
             to_save_path = DOWNLOAD_DEFAULT_FOLDER
 
-        headers_dict = {'user-key': self.user_key.key}
         endpoint = f'{self.__API_ENDPOINT_TAXONOMY}{API_SNAPSHOTS_COMPANIES_PIT}/{identifier}/{file_format}'
 
-        local_file_name = req.download_file(endpoint, headers_dict, file_name,
+        local_file_name = req.download_file(endpoint, self._auth_headers, file_name,
                                             file_format, to_save_path,
-                                            add_timestamp)
+                                            add_timestamp, chunk_size)
         return local_file_name
 
     @factiva_logger
@@ -137,15 +145,69 @@ class Company():
         """
 
         self.validate_point_time_request(identifier)
-        headers_dict = {'user-key': self.user_key.key}
+        return self._send_point_in_time_query(identifier, value)
+
+    @factiva_logger
+    def point_in_time_query_many(self, identifier, values, max_workers=16) -> list:
+        """Returns the resolved Factiva code and date ranges for several values of the same identifier.
+
+        The queries are sent concurrently from a thread pool. The identifier
+        is validated only once.
+
+        Parameters
+        ----------
+        identifier : str
+            A company identifier type
+        values : list
+            Identifier values
+        max_workers : int, optional
+            Maximum number of queries sent at the same time
+
+        Returns
+        -------
+        list:
+            Factiva code and date ranges for each value, in the same order as values
+
+        Raises
+        ------
+        ValueError: When the user is not allowed to permorm this operation
+        ValueError: When the identifier requested is not valid
+        RuntimeError: When any of the queries returns an unexpected HTTP status
+        """
+
+        self.validate_point_time_request(identifier)
+        results = [None] * len(values)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._send_point_in_time_query, identifier, value): index
+                       for index, value in enumerate(values)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    def _send_point_in_time_query(self, identifier, value) -> dict:
         endpoint = f'{self.__API_ENDPOINT_COMPANY}{API_SNAPSHOTS_COMPANIES_PIT}/{identifier}/{value}'
 
         response = req.api_send_request(endpoint_url=endpoint,
-                                        headers=headers_dict)
+                                        headers=self._auth_headers)
         if response.status_code == 200:
-            response = response.json()
+            response = req.api_json(response)
             return response
         else:
             raise RuntimeError(
                 '''Unexpected HTTP Response from API while checking for limits'''
             )
+
+    async def point_in_time_query_async(self, identifier, value) -> dict:
+        """Returns the resolved Factiva code and date ranges without blocking the event loop.
+
+        Same as `point_in_time_query`, but the request runs in the default
+        executor so several queries can be awaited concurrently.
+
+        Examples
+        --------
+        Resolving several tickers at once
+            >>> c = Company()
+            >>> await asyncio.gather(*(c.point_in_time_query_async('ticker_exchange', t) for t in tickers))
+
+        """
+        return await req.run_blocking(self.point_in_time_query, identifier, value)
@@ -1,10 +1,142 @@
 """Taxonomy class implementation."""
-from io import StringIO
+import asyncio
+import copy
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from pathlib import Path
 
 import pandas as pd
-from factiva.core import (UserKey, const, factiva_logger, get_factiva_logger,
-                          req)
+from factiva.core import UserKey, const, factiva_logger, get_factiva_logger
 from factiva.core.tools import validate_type
+from factiva.news import req
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+log = get_factiva_logger()
+
+# Category codes cache. Only used when requested with use_cache=True
+TAXONOMY_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Columns holding the codes in the category CSV files. Always parsed as text,
+# so codes that look like numbers or like missing values (NA, NULL) keep their
+# exact spelling
+CODE_COLUMNS = ('code', 'Code', 'executiveFactivaCode')
+
+# Seconds the company identifiers of a user key are reused before requesting them again
+IDENTIFIERS_CACHE_TTL = 60 * 60
+
+# Category code columns with fewer distinct values than this share of the rows are stored as categorical
+CATEGORY_DTYPE_MAX_UNIQUE_RATIO = 0.5
+
+
+def get_taxonomy_cache_dir() -> Path:
+    """Get the folder where taxonomy category codes are cached.
+
+    Taken from the FACTIVA_CACHE_DIR environment variable, or
+    ~/.factiva/taxonomy_cache when not set.
+
+    """
+    cache_dir = os.getenv('FACTIVA_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir).expanduser() / 'taxonomy_cache'
+    return Path.home() / '.factiva' / 'taxonomy_cache'
+
+
+def read_category_csv(source) -> pd.DataFrame:
+    """Parse a category codes CSV file.
+
+    The code columns go through a str converter, which pandas applies to the
+    raw text without checking it against its missing value spellings.
+
+    """
+    return pd.read_csv(source, engine='c', converters=dict.fromkeys(CODE_COLUMNS, str))
+
+
+def write_category_cache(codes_df, cache_path):
+    """Store category codes in cache_path, as parquet when pyarrow is installed or as CSV otherwise.
+
+    The file is written aside and then renamed, so readers never load a
+    partial file.
+
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f'{cache_path.name}.tmp')
+    if cache_path.suffix == '.parquet':
+        codes_df.to_parquet(tmp_path)
+    else:
+        codes_df.to_csv(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+
+def read_category_cache(cache_path) -> pd.DataFrame:
+    """Load category codes stored by `write_category_cache`."""
+    if cache_path.suffix == '.parquet':
+        return pd.read_parquet(cache_path)
+    return prepare_category_codes(read_category_csv(cache_path))
+
+
+def prepare_category_codes(codes_df) -> pd.DataFrame:
+    """Index a category codes DataFrame by code and compact its repetitive columns.
+
+    The code column is named differently depending on the category
+    (code, Code or executiveFactivaCode). The index is always named 'code'.
+
+    """
+    code_column = next((column for column in ('executiveFactivaCode', 'Code') if column in codes_df.columns), 'code')
+    codes_df = codes_df.set_index(code_column)
+    codes_df.index.name = 'code'
+
+    # Columns with many repeated values (e.g. parent codes) take less memory as categories
+    text_columns = codes_df.select_dtypes(include=['object', 'string'])
+    unique_counts = text_columns.nunique()
+    categorical_columns = unique_counts.index[unique_counts < len(codes_df) * CATEGORY_DTYPE_MAX_UNIQUE_RATIO]
+    if len(categorical_columns):
+        codes_df = codes_df.astype(dict.fromkeys(categorical_columns, 'category'))
+    return codes_df
+
+
+class CodeLookup():
+    """Lookup table of the codes of a category, built once from its DataFrame.
+
+    When a code has several rows, the first one is used. For companies listed
+    on several exchanges, the first row of the primary exchange is preferred.
+
+    Parameters
+    ----------
+    codes_df : pandas.DataFrame
+        Category codes indexed by code, as returned by `Taxonomy.get_category_codes`
+
+    """
+
+    __slots__ = ('codes_df', 'code_rows', 'columns', 'values')
+
+    def __init__(self, codes_df):
+        """Class initializer."""
+        self.codes_df = codes_df
+        self.columns = tuple(codes_df.columns)
+        self.values = codes_df.to_numpy(dtype=object)
+        codes = codes_df.index.tolist()
+        self.code_rows = {}
+        if {'exchange', 'primary_exchange'}.issubset(codes_df.columns):
+            is_primary = (codes_df['exchange'].astype(object) == codes_df['primary_exchange'].astype(object)).tolist()
+            for row_index, code in enumerate(codes):
+                if is_primary[row_index]:
+                    self.code_rows.setdefault(code, row_index)
+        for row_index, code in enumerate(codes):
+            self.code_rows.setdefault(code, row_index)
+
+    def get(self, code):
+        """Get the row of a code as a dict, or None when the code does not exist."""
+        row_index = self.code_rows.get(code)
+        if row_index is None:
+            return None
+        return dict(zip(self.columns, self.values[row_index]))
 
 
 class Taxonomy():
@@ -30,14 +162,27 @@ class Taxonomy():
 
     categories = []
     identifiers = []
+    # Maximum number of company codes sent in a single POST request
+    _BATCH_SIZE = 100
+    # Company identifiers by user key, as (time requested, identifiers)
+    _identifiers_cache = {}
+    # CodeLookup tables used by resolve_code by (user key, category), shared by all the instances
+    _shared_code_lookups = {}
+
+    __API_ENDPOINT_TAXONOMY = f'{const.API_HOST}{const.API_SNAPSHOTS_TAXONOMY_BASEPATH}'
+    __API_ENDPOINT_IDENTIFIERS = f'{const.API_HOST}{const.API_SNAPSHOTS_COMPANY_IDENTIFIERS_BASEPATH}'
+    __API_ENDPOINT_COMPANY = f'{const.API_HOST}{const.API_SNAPSHOTS_COMPANIES_BASEPATH}'
 
 
     def __init__(self, user_key=None):
         """Class initializer."""
         self.user_key = UserKey.create_user_key(user_key)
+        self._auth_headers = {'user-key': self.user_key.key}
         self.categories = self.get_categories()
         self.identifiers = self.get_identifiers()
-        self.log= get_factiva_logger()
+        self.category_codes = {}
+        self._single_code_cache = {}
+        self.log = log
 
     @factiva_logger
     def get_categories(self) -> list:
@@ -64,16 +209,12 @@ class Taxonomy():
             ['news_subjects', 'regions', 'companies', 'industries', 'executives']
 
         """
-        headers_dict = {
-            'user-key': self.user_key.key
-        }
-
-        endpoint = f'{const.API_HOST}{const.API_SNAPSHOTS_TAXONOMY_BASEPATH}'
+        endpoint = self.__API_ENDPOINT_TAXONOMY
 
-        response = req.api_send_request(method='GET', endpoint_url=endpoint, headers=headers_dict)
+        response = req.api_send_request(method='GET', endpoint_url=endpoint, headers=self._auth_headers)
 
         if response.status_code == 200:
-            return [entry['attributes']['name'] for entry in response.json()['data']]
+            return [entry['attributes']['name'] for entry in req.api_json(response)['data']]
 
         raise RuntimeError('API Request returned an unexpected HTTP status')
 
@@ -81,6 +222,10 @@ class Taxonomy():
     def get_identifiers(self) -> list:
         """Request for a list of available taxonomy categories.
 
+        Identifiers rarely change, so the response is shared by all the
+        Taxonomy instances of the same user key for IDENTIFIERS_CACHE_TTL
+        seconds.
+
         Returns
         -------
         List of available taxonomy categories.
@@ -102,16 +247,18 @@ class Taxonomy():
             ['news_subjects', 'regions', 'companies', 'industries', 'executives']
 
         """
-        headers_dict = {
-            'user-key': self.user_key.key
-        }
+        cached = self._identifiers_cache.get(self.user_key.key)
+        if cached is not None and time.monotonic() - cached[0] < IDENTIFIERS_CACHE_TTL:
+            return copy.deepcopy(cached[1])
 
-        endpoint = f'{const.API_HOST}{const.API_SNAPSHOTS_COMPANY_IDENTIFIERS_BASEPATH}'
+        endpoint = self.__API_ENDPOINT_IDENTIFIERS
 
-        response = req.api_send_request(method='GET', endpoint_url=endpoint, headers=headers_dict)
+        response = req.api_send_request(method='GET', endpoint_url=endpoint, headers=self._auth_headers)
 
         if response.status_code == 200:
-            return response.json()['data']['attributes']
+            identifiers = req.api_json(response)['data']['attributes']
+            Taxonomy._identifiers_cache[self.user_key.key] = (time.monotonic(), identifiers)
+            return copy.deepcopy(identifiers)
 
         raise RuntimeError('API Request returned an unexpected HTTP status')
 
@@ -121,14 +268,34 @@ class Taxonomy():
     # https://github.com/dowjones/factiva-news-python/issues/4#issue-956942535
     # Check also differences by loading the data in AVRO. In case the issue is
     # too common with Executives, force the download option.
+    def get_category_cache_path(self, category) -> Path:
+        """Get the cache file for the codes of a category.
+
+        Codes may differ between accounts, so the file name includes a hash
+        of the user key.
+
+        """
+        key_hash = hashlib.sha1(self.user_key.key.encode()).hexdigest()[:8]
+        extension = 'parquet' if pa is not None else 'csv'
+        return get_taxonomy_cache_dir() / f'{category}-{key_hash}.{extension}'
+
     @factiva_logger
-    def get_category_codes(self, category) -> pd.DataFrame:
+    def get_category_codes(self, category, use_cache=False, cache_ttl=TAXONOMY_CACHE_TTL) -> pd.DataFrame:
         """Request for available codes in the taxonomy for the specified category.
 
         Parameters
         ----------
         category : str
             String with the name of the taxonomy category to request the codes from
+        use_cache : bool, optional
+            When True, codes downloaded previously for the same category and
+            user key are loaded from disk instead of being requested again,
+            and new downloads are stored (see FACTIVA_CACHE_DIR). Once
+            expired, the cached codes are still used if the API answers the
+            request sent with their ETag with 304 Not Modified.
+            (Default is False)
+        cache_ttl : int, optional
+            Seconds cached codes are considered valid. (Default is 7 days)
 
         Returns
         -------
@@ -155,26 +322,193 @@ class Taxonomy():
         """
         validate_type(category, str, 'Unexpected value: category value must be string')
 
-        response_format = 'csv'
+        headers_dict = self._auth_headers
+        if use_cache:
+            cache_path = self.get_category_cache_path(category)
+            etag_path = cache_path.with_suffix('.etag')
+            if cache_path.exists() and time.time() - cache_path.stat().st_mtime < cache_ttl:
+                return read_category_cache(cache_path)
+            # An expired copy is still used when the API confirms it has not changed
+            if cache_path.exists() and etag_path.exists():
+                headers_dict = dict(headers_dict, **{'If-None-Match': etag_path.read_text()})
 
-        headers_dict = {
-            'user-key': self.user_key.key
-        }
+        response_format = 'csv'
 
-        endpoint = f'{const.API_HOST}{const.API_SNAPSHOTS_TAXONOMY_BASEPATH}/{category}/{response_format}'
+        endpoint = f'{self.__API_ENDPOINT_TAXONOMY}/{category}/{response_format}'
 
         response = req.api_send_request(method='GET', endpoint_url=endpoint, headers=headers_dict, stream=True)
+        if use_cache and response.status_code == 304:
+            os.utime(cache_path)
+            return read_category_cache(cache_path)
         if response.status_code == 200:
-            r_df = pd.read_csv(StringIO(response.content.decode()))
-            if 'executiveFactivaCode' in r_df.columns:
-                r_df.rename(columns = {'executiveFactivaCode':'code'}, inplace = True)
-            elif 'Code' in r_df.columns:
-                r_df.rename(columns = {'Code':'code'}, inplace = True)
-            r_df.set_index('code', inplace=True)
+            # Parse the body while it is downloaded, without buffering it first
+            response.raw.decode_content = True
+            r_df = read_category_csv(response.raw)
+            r_df = prepare_category_codes(r_df)
+            if use_cache:
+                # The old ETag is dropped first, so an interrupted update never
+                # pairs it with the new codes or a new ETag with the old ones
+                if etag_path.exists():
+                    etag_path.unlink()
+                write_category_cache(r_df, cache_path)
+                etag = response.headers.get('ETag')
+                if etag:
+                    tmp_etag_path = etag_path.with_name(f'{etag_path.name}.tmp')
+                    tmp_etag_path.write_text(etag)
+                    os.replace(tmp_etag_path, etag_path)
             return r_df
 
         raise RuntimeError('API Request returned an unexpected HTTP Status')
 
+    def prefetch_category_codes(self, categories=None, max_workers=4, use_cache=False) -> dict:
+        """Download the codes of several categories at the same time.
+
+        The downloads run in a thread pool and the results are stored in
+        `category_codes`, where `resolve_code` finds them.
+
+        Parameters
+        ----------
+        categories : list, optional
+            Names of the categories to download. All the available categories
+            (`categories`) when not given.
+        max_workers : int, optional
+            Maximum number of categories downloaded at the same time
+        use_cache : bool, optional
+            Passed to `get_category_codes`. (Default is False)
+
+        Returns
+        -------
+        Dict with the DataFrame of each downloaded category
+
+        Raises
+        ------
+        RuntimeError: When API request returns unexpected error
+
+        Examples
+        --------
+        Downloading the codes used to annotate articles
+            >>> taxonomy = Taxonomy()
+            >>> taxonomy.prefetch_category_codes(['news_subjects', 'regions', 'industries'])
+            >>> print(taxonomy.resolve_code('industries', 'i257'))
+            {'description': 'Pharmaceuticals'}
+
+        """
+        if categories is None:
+            categories = self.categories
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.get_category_codes, category, use_cache): category
+                       for category in categories}
+            for future in as_completed(futures):
+                self.category_codes[futures[future]] = future.result()
+
+        return {category: self.category_codes[category] for category in categories}
+
+    def resolve_code(self, category, code, code_type=None) -> dict:
+        """Get the details of a single code in a taxonomy category.
+
+        The codes of each category are requested with `get_category_codes` the
+        first time the category is used in the process with the same user
+        key, and kept in `category_codes` for the following lookups. Lookups go through a plain dict built once per
+        category, so resolving many codes (e.g. while annotating articles)
+        does not pay the pandas indexing overhead on every call.
+
+        Parameters
+        ----------
+        category : str
+            String with the name of the taxonomy category the code belongs to
+        code : str
+            Code to look up
+        code_type : str, optional
+            Only for the 'companies' category. When given (e.g. isin, ticker),
+            the code is resolved with `get_single_company` and kept apart from
+            the category table, so the whole companies category (much larger
+            than a single company) is never downloaded.
+
+        Returns
+        -------
+        Dict with the columns of the code row, e.g. its description
+
+        Raises
+        ------
+        ValueError: When the code does not exist in the category
+        RuntimeError: When API request returns unexpected error
+
+        Examples
+        --------
+        Resolving an industry code
+            >>> taxonomy = Taxonomy()
+            >>> print(taxonomy.resolve_code('industries', 'i257'))
+            {'description': 'Pharmaceuticals'}
+
+        """
+        if code_type is not None:
+            if category != 'companies':
+                raise ValueError('code_type can only be used with the companies category')
+            return self._resolve_single_company(code_type, code)
+
+        resolved = self._get_code_lookup(category).get(code)
+        if resolved is None:
+            raise ValueError(f'Code {code} not found in category {category}')
+        return resolved
+
+    def resolve_codes(self, category, codes) -> list:
+        """Get the details of several codes of a taxonomy category at once.
+
+        Same as calling `resolve_code` for each code, but codes that do not
+        exist in the category return None instead of raising an error.
+
+        Parameters
+        ----------
+        category : str
+            String with the name of the taxonomy category the codes belong to
+        codes : list
+            Codes to look up
+
+        Returns
+        -------
+        List with a dict for each code, in the same order as codes
+
+        Raises
+        ------
+        RuntimeError: When API request returns unexpected error
+
+        Examples
+        --------
+        Resolving the industry codes of an article
+            >>> taxonomy = Taxonomy()
+            >>> print(taxonomy.resolve_codes('industries', ['i257', 'i643']))
+            [{'description': 'Pharmaceuticals'}, {'description': 'Pharmacies/Drug Stores'}]
+
+        """
+        lookup = self._get_code_lookup(category)
+        return [lookup.get(code) for code in codes]
+
+    def _get_code_lookup(self, category):
+        shared_key = (self.user_key.key, category)
+        codes_df = self.category_codes.get(category)
+        if codes_df is None:
+            shared_lookup = self._shared_code_lookups.get(shared_key)
+            if shared_lookup is not None:
+                codes_df = shared_lookup.codes_df
+            else:
+                codes_df = self.get_category_codes(category)
+            self.category_codes[category] = codes_df
+
+        # A lookup built from a previous DataFrame of the category is stale
+        lookup = self._shared_code_lookups.get(shared_key)
+        if lookup is None or lookup.codes_df is not codes_df:
+            lookup = CodeLookup(codes_df)
+            Taxonomy._shared_code_lookups[shared_key] = lookup
+        return lookup
+
+    def _resolve_single_company(self, code_type, code) -> dict:
+        resolved = self._single_code_cache.get((code_type, code))
+        if resolved is None:
+            resolved = self.get_single_company_raw(code_type, code)
+            self._single_code_cache[(code_type, code)] = resolved
+        return dict(resolved)
+
     @factiva_logger
     def get_single_company(self, code_type, company_code) -> pd.DataFrame:
         """Request information about a single company.
@@ -203,34 +537,120 @@ class Taxonomy():
                          id  fcode           common_name
             0  ABCNMST00394  ABCYT  Systemy Company S.A.
 
+        """
+        return pd.DataFrame.from_records([self.get_single_company_raw(code_type, company_code)])
+
+    def get_single_company_raw(self, code_type, company_code) -> dict:
+        """Request information about a single company, returned as it is sent by the API.
+
+        Same as `get_single_company`, without building a DataFrame. Cheaper
+        when only a few fields of each company are used.
+
+        Returns
+        -------
+        Dict containing the company information
+
+        Examples
+        --------
+        Get the company name using the code type 'isin' and the company code 'ABCNMST00394'
+            >>> taxonomy = Taxonomy()
+            >>> print(taxonomy.get_single_company_raw('isin', 'ABCNMST00394')['common_name'])
+            Systemy Company S.A.
+
         """
         validate_type(code_type, str, 'Unexpected value: code_type must be str')
         validate_type(company_code, str, 'Unexpected value: company must be str')
 
-        headers_dict = {
-            'user-key': self.user_key.key
-        }
-
-        endpoint = f'{const.API_HOST}{const.API_SNAPSHOTS_COMPANIES_BASEPATH}/{code_type}/{company_code}'
+        endpoint = f'{self.__API_ENDPOINT_COMPANY}/{code_type}/{company_code}'
 
-        response = req.api_send_request(method='GET', endpoint_url=endpoint, headers=headers_dict)
+        response = req.api_send_request(method='GET', endpoint_url=endpoint, headers=self._auth_headers)
 
         if response.status_code == 200:
-            response_data = response.json()
-            return pd.DataFrame.from_records([response_data['data']['attributes']])
+            return req.api_json(response)['data']['attributes']
 
         raise RuntimeError('API Request returned an unexpected HTTP status')
 
+    async def get_single_company_async(self, code_type, company_code) -> pd.DataFrame:
+        """Request information about a single company without blocking the event loop.
+
+        Same as `get_single_company`, but the request runs in the default
+        executor so several lookups can be awaited concurrently.
+
+        """
+        return await req.run_blocking(self.get_single_company, code_type, company_code)
+
+    async def get_companies_concurrent_async(self, code_type, company_codes, max_concurrency=16) -> pd.DataFrame:
+        """Request information about several companies, one request per code, concurrently.
+
+        `get_companies_chunked` is cheaper for long lists: it sends one POST
+        per 100 codes instead of one GET per code. Use this method when the
+        single company endpoint is needed.
+
+        Parameters
+        ----------
+        code_type : str
+            String describing the code type used to request the information about the company. E.g. isin, ticker.
+        company_codes : list
+            List containing the company codes to request information about
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time. Keeps the
+            lookups within the API rate limits.
+
+        Returns
+        -------
+        DataFrame containing the information of all the companies, in the same
+        order as company_codes
+
+        Raises
+        ------
+        RuntimeError: When API request returns unexpected error
+
+        """
+        validate_type(company_codes, list, 'Unexpected value: companies must be list')
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_one(company_code):
+            async with semaphore:
+                return await self.get_single_company_async(code_type, company_code)
+
+        frames = await asyncio.gather(*(get_one(company_code) for company_code in company_codes))
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def get_companies_concurrent(self, code_type, company_codes, max_concurrency=16) -> pd.DataFrame:
+        """Request information about several companies, one request per code, concurrently.
+
+        Blocking wrapper around `get_companies_concurrent_async`. It can not be
+        called from a running event loop; await `get_companies_concurrent_async`
+        there instead. `get_companies_chunked` is cheaper for long lists: it
+        sends one POST per 100 codes instead of one GET per code.
+
+        Examples
+        --------
+        Resolving a list of ISIN codes
+            >>> taxonomy = Taxonomy()
+            >>> companies_data = taxonomy.get_companies_concurrent('isin', ['US0378331005', 'US0231351067'])
+
+        """
+        return asyncio.run(self.get_companies_concurrent_async(code_type, company_codes, max_concurrency))
+
     @factiva_logger
-    def get_multiple_companies(self, code_type, company_codes) -> pd.DataFrame:
+    def get_multiple_companies(self, code_type, company_codes, preserve_input_order=False) -> pd.DataFrame:
         """Request information about a list of companies.
 
+        Duplicated codes are sent only once.
+
         Parameters
         ----------
         code_type : str
             String describing the code type used to request the information about the company. E.g. isin, ticker.
         companies_codes : list
             List containing the company codes to request information about
+        preserve_input_order : bool, optional
+            When True, the result has one row per given code, duplicates
+            included, in the same order as company_codes. Codes not found have
+            empty values. (Default is False)
 
         Returns
         -------
@@ -257,27 +677,73 @@ class Taxonomy():
         for single_company_code in company_codes:
             validate_type(single_company_code, str, 'Unexpected value: each company in companies must be str')
 
-        headers_dict = {
-            'user-key': self.user_key.key
-        }
-
         payload_dict = {
             "data": {
                 "attributes": {
-                    "ids": company_codes
+                    "ids": list(dict.fromkeys(company_codes))
                 }
             }
         }
 
-        endpoint = f'{const.API_HOST}{const.API_SNAPSHOTS_COMPANIES_BASEPATH}/{code_type}'
+        endpoint = f'{self.__API_ENDPOINT_COMPANY}/{code_type}'
 
-        response = req.api_send_request(method='POST', endpoint_url=endpoint, headers=headers_dict, payload=payload_dict)
+        response = req.api_send_request(method='POST', endpoint_url=endpoint, headers=self._auth_headers, payload=payload_dict)
 
         if response.status_code == 200 or response.status_code == 207:
-            response_data = response.json()
-            return pd.DataFrame.from_records(response_data['data']['attributes']['successes'])
+            response_data = req.api_json(response)
+            companies_df = pd.DataFrame.from_records(response_data['data']['attributes']['successes'])
+            if preserve_input_order and companies_df.empty:
+                companies_df = pd.DataFrame({'id': company_codes})
+            elif preserve_input_order:
+                # The API may return several rows for the same id, and reindex needs a unique index
+                companies_df = companies_df.drop_duplicates('id').set_index('id').reindex(company_codes).rename_axis('id').reset_index()
+            return companies_df
         raise RuntimeError(f'API Request returned an unexpected HTTP status with message: {response.text}')
 
+    def get_companies_chunked(self, code_type, company_codes, batch_size=None) -> pd.DataFrame:
+        """Request information about a list of companies, sending the codes in batches.
+
+        Each batch of up to `batch_size` codes is requested with a single call
+        to `get_multiple_companies`, so N codes take ceil(N / batch_size)
+        requests.
+
+        Parameters
+        ----------
+        code_type : str
+            String describing the code type used to request the information about the company. E.g. isin, ticker.
+        company_codes : list
+            List containing the company codes to request information about
+        batch_size : int, optional
+            Maximum number of codes per request. Defaults to Taxonomy._BATCH_SIZE.
+
+        Returns
+        -------
+        DataFrame containing the information of all the companies
+
+        Raises
+        ------
+        ValueError: When any given argument is not of the expected type
+        RuntimeError: When API request returns unexpected error
+
+        """
+        validate_type(company_codes, list, 'Unexpected value: companies must be list')
+        if batch_size is None:
+            batch_size = self._BATCH_SIZE
+        validate_type(batch_size, int, 'Unexpected value: batch_size must be int')
+        if batch_size <= 0:
+            raise ValueError('batch_size value is not valid or not positive')
+
+        codes = iter(dict.fromkeys(company_codes))
+        frames = []
+        for chunk in iter(lambda: list(islice(codes, batch_size)), []):
+            frames.append(self.get_multiple_companies(code_type, chunk))
+
+        if len(frames) == 1:
+            return frames[0]
+        if not frames:
+            return self.get_multiple_companies(code_type, [])
+        return pd.concat(frames, ignore_index=True)
+
     @factiva_logger
     def get_company(self, code_type, company_codes) -> pd.DataFrame:
         """Request information about either a single company or a list of companies.
@@ -291,7 +757,9 @@ class Taxonomy():
 
         Returns
         -------
-        Dataframe with the information about the requested company(ies)
+        Dataframe with the information about the requested company(ies). A
+        list is always requested through the batch endpoint, in chunks of
+        Taxonomy._BATCH_SIZE codes (see `get_companies_chunked`).
 
         Raises
         ------
@@ -322,6 +790,6 @@ class Taxonomy():
         if type(company_codes) is str:
             return self.get_single_company(code_type, company_codes)
         elif type(company_codes) is list:
-            return self.get_multiple_companies(code_type, company_codes)
+            return self.get_companies_chunked(code_type, company_codes)
         else:
             raise ValueError('company_codes must be a string or a list')
@@ -42,7 +42,9 @@ COLUMN_NAMES = [
     "word_count",
 ]
 
+_COLUMN_NAMES_SET = frozenset(COLUMN_NAMES)
+
 
 def format_message_to_response_schema(msg):
-    new = {k: v for (k, v) in msg.items() if k in COLUMN_NAMES}
+    new = {k: v for (k, v) in msg.items() if k in _COLUMN_NAMES_SET}
     return new
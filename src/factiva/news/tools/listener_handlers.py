@@ -1,4 +1,3 @@
-import copy
 import datetime
 import json
 import os
@@ -9,11 +8,16 @@ from pymongo import MongoClient
 
 from .bq_schemas import *
 
+log = get_factiva_logger()
+
+_ALLOWED_ACTIONS = frozenset(const.ALLOWED_ACTIONS)
+
+
 class JSONLFileHandler:
     def __init__(self):
         """Initialize class constructor."""
         self.counter = 0
-        self.log = get_factiva_logger()
+        self.log = log
 
     def write_jsonl_line(self, file_prefix, action, file_suffix, message):
         """Write a new Jsonl line.
@@ -55,19 +59,20 @@ class JSONLFileHandler:
         self.log.info("Saving into JSONL file")
         tools.create_path_if_not_exist(const.LISTENER_FILES_DEFAULT_FOLDER)
 
+        received_at = datetime.datetime.utcnow()
         errorFile = os.path.join(const.LISTENER_FILES_DEFAULT_FOLDER, 'errors.log')
-        erroMessage = f"{datetime.datetime.utcnow()}\tERR\t$$ERROR$$\t$$MESSAGE$$\n"
+        erroMessage = f"{received_at}\tERR\t$$ERROR$$\t$$MESSAGE$$\n"
 
-        stream_short_id = subscription_id.split('-')[-3]
-        current_hour = datetime.datetime.utcnow().strftime('%Y%m%d%H')
+        stream_short_id = subscription_id.rsplit('-', 3)[-3]
+        current_hour = received_at.strftime('%Y%m%d%H')
 
-        if 'action' in message.keys():
+        if 'action' in message:
 
             message = tools.format_timestamps(message)
             message = tools.format_multivalues(message)
             current_action = message['action']
 
-            if current_action in const.ALLOWED_ACTIONS:
+            if current_action in _ALLOWED_ACTIONS:
                 print(const.ACTION_CONSOLE_INDICATOR[current_action], end='')
                 self.write_jsonl_line(stream_short_id, current_action,
                                       current_hour, message)
@@ -103,7 +108,7 @@ class BigQueryHandler:
         self.client = bigquery.Client()
         self.counter = 0
         self.log_line = ''
-        self.log = get_factiva_logger()
+        self.log = log
 
     @factiva_logger
     def save(self, message, subscription_id) -> bool:
@@ -126,14 +131,16 @@ class BigQueryHandler:
         errorFile = os.path.join(const.LISTENER_FILES_DEFAULT_FOLDER, 'errors.log')
         erroMessage = f"{datetime.datetime.utcnow()}\tERR\t$$ERROR$$\t$$MESSAGE$$\n"
         ret_val = False
-        _msg = copy.deepcopy(message)
+        # The formatting below only replaces top-level fields, so a shallow
+        # copy keeps the original message intact for the error files
+        _msg = dict(message)
         msg_an = _msg['an']
 
         try:
-            if 'action' in _msg.keys():
+            if 'action' in _msg:
                 msg_an = _msg['an']
                 current_action = _msg['action']
-                if current_action in const.ALLOWED_ACTIONS:
+                if current_action in _ALLOWED_ACTIONS:
                     _msg = tools.format_timestamps(_msg)
                     _msg = tools.format_multivalues(_msg)
                     _msg = format_message_to_response_schema(_msg)
@@ -184,7 +191,7 @@ class MongoDBHandler:
     def __init__(self):
         """Initialize class constructor."""
         self.counter = 0
-        self.log = get_factiva_logger()
+        self.log = log
 
         connection_string = os.getenv('MONGODB_CONNECTION_STRING', None)
         database_name = os.getenv('MONGODB_DATABASE_NAME', None)
@@ -221,13 +228,13 @@ class MongoDBHandler:
         errorFile = os.path.join(const.LISTENER_FILES_DEFAULT_FOLDER, 'errors.log')
         erroMessage = f"{datetime.datetime.utcnow()}\tERR\t$$ERROR$$\t$$MESSAGE$$\n"
 
-        if 'action' in message.keys():
+        if 'action' in message:
 
             message = tools.format_timestamps_mongodb(message)
             message = tools.format_multivalues(message)
             current_action = message['action']
 
-            if current_action in const.ALLOWED_ACTIONS:
+            if current_action in _ALLOWED_ACTIONS:
                 print(const.ACTION_CONSOLE_INDICATOR[current_action], end='')
                 self.mongodb_collection.insert_one(message)
 
@@ -0,0 +1,60 @@
+"""Stubs shared by the offline tests, which replace the API calls with monkeypatch."""
+import io
+
+import pytest
+from factiva.news import Taxonomy
+from factiva.news.bulknews import BulkNewsJob
+
+
+class StubUserKey:
+    """Stand-in for UserKey and StreamUser that never reaches the API."""
+
+    key = 'abcd1234abcd1234abcd1234abcd1234'
+
+    def get_authentication_headers(self):
+        return {'user-key': self.key}
+
+    def get_uri_context(self):
+        return 'https://api.test'
+
+
+class StubResponse:
+    """Stand-in for the requests.Response returned by req.api_send_request."""
+
+    def __init__(self, status_code=200, body=b'', headers=None):
+        self.status_code = status_code
+        self.raw = io.BytesIO(body)
+        self.text = body.decode()
+        self.headers = headers or {}
+
+
+@pytest.fixture(name='user_key')
+def fixture_user_key():
+    return StubUserKey()
+
+
+@pytest.fixture(name='stub_response')
+def fixture_stub_response():
+    return StubResponse
+
+
+@pytest.fixture(name='create_job')
+def fixture_create_job(user_key):
+    """Return a factory of jobs created without __init__, which requests the user key from the API."""
+
+    def create_job(job_class=BulkNewsJob, **attributes):
+        job = job_class.__new__(job_class)
+        job.user_key = user_key
+        for name, value in attributes.items():
+            setattr(job, name, value)
+        return job
+
+    return create_job
+
+
+@pytest.fixture(name='taxonomy')
+def fixture_taxonomy(user_key):
+    taxonomy = Taxonomy.__new__(Taxonomy)
+    taxonomy.user_key = user_key
+    taxonomy._auth_headers = user_key.get_authentication_headers()
+    return taxonomy
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+
+import pytest
+from factiva.core import const
+from factiva.news import bulknews as bulknews_module
+from factiva.news.bulknews import API_JOB_MAX_WAIT, BulkNewsJob, _FileWriter, get_poll_delay
+
+JOB_LINK = 'https://api.test/jobs/1'
+RUNNING_STATE = const.API_JOB_EXPECTED_STATES[0]
+
+
+def stub_status_requests(monkeypatch, stub_response, responses):
+    """Send the given (status_code, elapsed_seconds) responses, and return the query string of every request."""
+    clock = [0.0]
+    sent_params = []
+
+    def send_request(method, endpoint_url, headers, qs_params=None):
+        status_code, elapsed = responses.pop(0)
+        sent_params.append(qs_params)
+        clock[0] += elapsed
+        return stub_response(status_code)
+
+    monkeypatch.setattr(bulknews_module.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(bulknews_module.req, 'api_send_request', send_request)
+    monkeypatch.setattr(bulknews_module.req, 'api_json',
+                        lambda response: {'data': {'attributes': {'current_state': RUNNING_STATE}}})
+    return sent_params
+
+
+def test_get_poll_delay():
+    for wait in (1, 2, 8):
+        assert wait <= get_poll_delay(wait) <= wait * 1.1
+    assert get_poll_delay(API_JOB_MAX_WAIT * 2) == API_JOB_MAX_WAIT
+    assert get_poll_delay(4, retry_after=12.5) == 12.5
+    assert get_poll_delay(4, retry_after=0) == 0
+
+
+def test_long_poll_delay(monkeypatch, create_job, stub_response):
+    stub_status_requests(monkeypatch, stub_response, [(200, 20), (200, 1)])
+    job = create_job(link=JOB_LINK, long_poll_wait=30)
+
+    job.get_job_results()
+    assert job._get_poll_delay(4) == 0
+
+    # A quick response means the API did not hold the request
+    job.get_job_results()
+    assert 4 <= job._get_poll_delay(4) <= 4.4
+
+
+def test_long_poll_not_supported(monkeypatch, create_job, stub_response):
+    sent_params = stub_status_requests(monkeypatch, stub_response, [(501, 0), (200, 0)])
+    job = create_job(link=JOB_LINK, long_poll_wait=30)
+
+    job.get_job_results()
+    assert sent_params == [{'wait': '30s'}, None]
+    assert job.long_poll_wait == 0
+    assert 4 <= job._get_poll_delay(4) <= 4.4
+
+
+def test_job_str_hides_private_fields(monkeypatch, create_job, stub_response):
+    stub_status_requests(monkeypatch, stub_response, [(200, 0)])
+    job = create_job(link=JOB_LINK)
+    job.job_id = '1'
+    job.get_job_results()
+    job_str = str(job)
+    assert f'link = {JOB_LINK}' in job_str
+    assert '_retry_after' not in job_str
+    assert '_long_poll_held' not in job_str
+
+
+def test_file_writer(tmp_path):
+    writer = _FileWriter(max_chunks=2)
+    first_path, second_path, empty_path = tmp_path / 'first.avro', tmp_path / 'second.avro', tmp_path / 'empty.avro'
+    for chunk in (b'ab', b'cd'):
+        writer.write(first_path, chunk)
+        writer.write(second_path, chunk.upper())
+    writer.close_file(first_path)
+    writer.close_file(empty_path)
+    writer.close()
+
+    assert first_path.read_bytes() == b'abcd'
+    assert second_path.read_bytes() == b'ABCD'
+    assert empty_path.read_bytes() == b''
+
+
+def test_file_writer_error(tmp_path):
+    writer = _FileWriter(max_chunks=1)
+
+    def write_chunks():
+        writer.write(tmp_path / 'missing' / 'file.avro', b'ab')
+        for _ in range(10):
+            writer.write(tmp_path / 'file.avro', b'cd')
+
+    # Producers are not blocked once the writer has failed
+    producer = threading.Thread(target=write_chunks, daemon=True)
+    producer.start()
+    producer.join(5)
+    assert not producer.is_alive()
+
+    with pytest.raises(FileNotFoundError):
+        writer.close()
+    assert not (tmp_path / 'file.avro').exists()
+
+
+def stub_file_downloads(monkeypatch, failed_uris=(), unwritable_uris=()):
+    """Replace BulkNewsJob.download_file, and return the downloaded (uri, path) pairs."""
+    downloads = []
+
+    def download_file(job, endpoint_url, download_path, writer=None):
+        downloads.append((endpoint_url, download_path))
+        if endpoint_url in unwritable_uris:
+            download_path = f'{download_path}.missing/file'
+        writer.write(download_path, endpoint_url.encode())
+        writer.close_file(download_path)
+        if endpoint_url in failed_uris:
+            raise RuntimeError(f'Download failed: {endpoint_url}')
+        return True
+
+    monkeypatch.setattr(BulkNewsJob, 'download_file', download_file)
+    return downloads
+
+
+def test_download_job_files(monkeypatch, tmp_path, create_job):
+    downloads = stub_file_downloads(monkeypatch)
+    job = create_job()
+    job.files = ['https://api.test/files/1.avro', 'https://api.test/files/2.avro', 'https://api.test/files/1.avro']
+
+    assert job.download_job_files(str(tmp_path))
+    assert sorted(downloads) == [('https://api.test/files/1.avro', f'{tmp_path}/1.avro'),
+                                 ('https://api.test/files/2.avro', f'{tmp_path}/2.avro')]
+    assert (tmp_path / '2.avro').read_bytes() == b'https://api.test/files/2.avro'
+
+    job.files = ['https://api.test/files/a/1.avro', 'https://api.test/files/b/1.avro']
+    with pytest.raises(ValueError):
+        job.download_job_files(str(tmp_path))
+
+
+def test_download_job_files_errors(monkeypatch, tmp_path, create_job):
+    job = create_job()
+    job.files = ['https://api.test/files/1.avro', 'https://api.test/files/2.avro']
+
+    stub_file_downloads(monkeypatch, unwritable_uris=job.files[:1])
+    with pytest.raises(FileNotFoundError):
+        job.download_job_files(str(tmp_path), max_workers=1)
+
+    # The download error is raised, with the write error as its cause
+    stub_file_downloads(monkeypatch, failed_uris=job.files[1:], unwritable_uris=job.files[:1])
+    with pytest.raises(RuntimeError, match='Download failed') as download_error:
+        job.download_job_files(str(tmp_path), max_workers=1)
+    assert isinstance(download_error.value.__cause__, FileNotFoundError)
+
+    with pytest.raises(RuntimeError, match='Download failed') as download_error:
+        asyncio.run(job.download_job_files_async(str(tmp_path)))
+    assert isinstance(download_error.value.__cause__, FileNotFoundError)
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+from factiva.core import const
+from factiva.news.bulknews import BulkNewsJob
+from factiva.news.snapshot.jobs import AnalyticsJob, ExtractionJob
+
+VALID_SNAPSHOT_ID = 'abcd123456'
+ANALYTICS_RESULTS = [
+    {'publication_datetime': '2018-01', 'count': 5, 'source_code': 'DJDN'},
+    {'publication_datetime': '2018-02', 'count': 7, 'source_code': 'WSJO'},
+]
+
+
+def test_analytics_job_cache(monkeypatch, tmp_path, create_job):
+    processed_payloads = []
+
+    def process_job(job, payload=None, use_latest_api_version=False):
+        processed_payloads.append(payload)
+        job.set_job_data({'data': {'attributes': {'results': ANALYTICS_RESULTS}}})
+        return True
+
+    monkeypatch.setenv('FACTIVA_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(BulkNewsJob, 'process_job', process_job)
+    payload = {'query': {'where': "publication_datetime >= '2018-01-01'"}}
+
+    job = create_job(AnalyticsJob)
+    job.process_job(payload, use_cache=True)
+    assert job.get_cache_path(payload).suffix == '.json'
+
+    cached_job = create_job(AnalyticsJob)
+    cached_job.process_job(payload, use_cache=True)
+    assert len(processed_payloads) == 1
+    assert cached_job.job_state == const.API_JOB_DONE_STATE
+    pd.testing.assert_frame_equal(cached_job.data, job.data)
+
+
+def test_analytics_job_data_missing_count(create_job):
+    job = create_job(AnalyticsJob)
+    results = ANALYTICS_RESULTS + [{'publication_datetime': '2018-03', 'count': None}]
+    job.set_job_data({'data': {'attributes': {'results': results}}})
+    assert job.data['count'].isna().tolist() == [False, False, True]
+
+    job.set_job_data({'data': {'attributes': {'results': ANALYTICS_RESULTS}}})
+    assert job.data['count'].dtype == 'int64'
+    assert job.data['source_code'].dtype == 'category'
+
+
+def test_extraction_job_id(create_job, user_key):
+    job = create_job(ExtractionJob)
+    full_id = f'dj-synhub-extraction-{user_key.key}-{VALID_SNAPSHOT_ID}'
+    assert job.get_job_id({'data': {'id': full_id}}) == VALID_SNAPSHOT_ID
+    with pytest.raises(ValueError):
+        job.get_job_id({'data': {'id': 'not-an-extraction-id'}})
+
+
+def test_process_many_pipelined_extraction_jobs(monkeypatch, create_job):
+    processed = []
+
+    def process_job(job, payload=None, use_latest_api_version=False):
+        processed.append((payload, use_latest_api_version))
+        return True
+
+    monkeypatch.setattr(BulkNewsJob, 'process_job', process_job)
+    monkeypatch.setattr(ExtractionJob, 'download_job_files', lambda job, path=None: True)
+    jobs = [create_job(ExtractionJob) for _ in range(3)]
+    payloads = [{'query': {'where': f'id = {index}'}} for index in range(3)]
+
+    completed = list(BulkNewsJob.process_many_pipelined(jobs, payloads, use_latest_api_version=True))
+    assert sorted(map(id, completed)) == sorted(map(id, jobs))
+    assert sorted(processed, key=str) == sorted(((payload, True) for payload in payloads), key=str)
@@ -0,0 +1,45 @@
+import pytest
+from factiva.news.stream import listener as listener_module
+from factiva.news.stream import Listener
+
+VALID_SUBSCRIPTION_ID = 'dj-synhub-stream-abcd1234-filtered-xyz'
+
+
+def test_check_account_status(monkeypatch, user_key, stub_response):
+    requested_urls = []
+
+    def send_request(method, endpoint_url, headers):
+        requested_urls.append(endpoint_url)
+        return stub_response(200)
+
+    monkeypatch.setattr(Listener, '_account_info_cache', {})
+    monkeypatch.setattr(listener_module.req, 'api_send_request', send_request)
+    monkeypatch.setattr(listener_module.req, 'api_json',
+                        lambda response: {'data': {'attributes': {'max_allowed_extracts': 5}}})
+
+    listener = Listener(VALID_SUBSCRIPTION_ID, user_key)
+    listener._check_account_status()
+    listener._check_account_status()
+    assert listener.limit_msg == 5
+    assert requested_urls == [f'https://api.test/accounts/{user_key.key}']
+
+    listener._check_account_status(force=True)
+    assert len(requested_urls) == 2
+
+
+def test_listener_without_subscription(monkeypatch, user_key):
+    monkeypatch.delenv('FACTIVA_STREAM_SUBSCRIPTION_ID', raising=False)
+    with pytest.raises(ValueError, match=listener_module.UNDEFINED_SUBSCRIPTION_MESSAGE) as first_error:
+        Listener(stream_user=user_key)
+    with pytest.raises(ValueError) as second_error:
+        Listener(stream_user=user_key)
+    assert first_error.value is not second_error.value
+
+
+def test_get_cache_ttl(monkeypatch):
+    monkeypatch.delenv('FACTIVA_INFO_TTL', raising=False)
+    assert listener_module.get_cache_ttl('FACTIVA_INFO_TTL', 30) == 30
+    monkeypatch.setenv('FACTIVA_INFO_TTL', '2.5')
+    assert listener_module.get_cache_ttl('FACTIVA_INFO_TTL', 30) == 2.5
+    monkeypatch.setenv('FACTIVA_INFO_TTL', 'thirty')
+    assert listener_module.get_cache_ttl('FACTIVA_INFO_TTL', 30) == 30
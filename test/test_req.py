@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import pytest
+from factiva.news import req as req_module
+
+ENDPOINT_URL = 'https://api.test/jobs/1'
+HEADERS = {'user-key': 'abcd1234abcd1234abcd1234abcd1234'}
+
+
+class WaitedFuture(Future):
+    """Future that signals when a thread starts waiting for its result."""
+
+    waiting = None
+
+    def result(self, timeout=None):
+        WaitedFuture.waiting.set()
+        return super().result(timeout)
+
+
+@pytest.fixture(name='sent_urls')
+def fixture_sent_urls(monkeypatch):
+    sent_urls = []
+
+    def send_get_request(endpoint_url, headers=None, qs_params=None):
+        sent_urls.append(endpoint_url)
+        return object()
+
+    monkeypatch.setattr(req_module, '_inflight', {})
+    monkeypatch.setattr(req_module, 'send_get_request', send_get_request)
+    return sent_urls
+
+
+def send_while_in_flight(monkeypatch, send_get_request):
+    """Send one request from a thread and a second identical one while the first is still in flight."""
+    started, release = threading.Event(), threading.Event()
+    WaitedFuture.waiting = threading.Event()
+    results = {}
+
+    def blocking_send_get_request(endpoint_url, headers=None, qs_params=None):
+        started.set()
+        release.wait(5)
+        return send_get_request()
+
+    def send(name):
+        try:
+            results[name] = req_module.send_coalesced_get_request(ENDPOINT_URL, headers=HEADERS)
+        except BaseException as error:  # pylint: disable=broad-except
+            results[name] = error
+
+    monkeypatch.setattr(req_module, 'Future', WaitedFuture)
+    monkeypatch.setattr(req_module, 'send_get_request', blocking_send_get_request)
+    owner = threading.Thread(target=send, args=('owner',))
+    owner.start()
+    assert started.wait(5)
+
+    waiter = threading.Thread(target=send, args=('waiter',))
+    waiter.start()
+    assert WaitedFuture.waiting.wait(5)
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+    return results
+
+
+def test_coalesced_request_shares_response(monkeypatch, sent_urls):
+    response = object()
+    calls = []
+
+    def send_get_request():
+        calls.append(1)
+        return response
+
+    results = send_while_in_flight(monkeypatch, send_get_request)
+    assert len(calls) == 1
+    assert results == {'owner': response, 'waiter': response}
+    assert not req_module._inflight
+
+
+def test_coalesced_request_shares_error(monkeypatch, sent_urls):
+    error = ConnectionError('connection reset')
+
+    def send_get_request():
+        raise error
+
+    results = send_while_in_flight(monkeypatch, send_get_request)
+    assert results == {'owner': error, 'waiter': error}
+    assert not req_module._inflight
+
+
+def test_coalesced_request_base_exception(monkeypatch, sent_urls):
+    def send_get_request():
+        raise KeyboardInterrupt
+
+    results = send_while_in_flight(monkeypatch, send_get_request)
+    assert not req_module._inflight
+    assert isinstance(results['waiter'], KeyboardInterrupt)
+    assert isinstance(results['owner'], KeyboardInterrupt)
+
+
+def test_coalesced_request_after_response(sent_urls):
+    req_module.send_coalesced_get_request(ENDPOINT_URL, headers=HEADERS)
+    req_module.send_coalesced_get_request(ENDPOINT_URL, headers=HEADERS)
+    assert sent_urls == [ENDPOINT_URL, ENDPOINT_URL]
+    assert not req_module._inflight
+
+
+def test_run_blocking():
+    def add(first, second, scale=1):
+        return threading.get_ident(), (first + second) * scale
+
+    thread_id, result = asyncio.run(req_module.run_blocking(add, 1, 2, scale=10))
+    assert result == 30
+    assert thread_id != threading.get_ident()
@@ -9,6 +9,16 @@ def test_base_query():
     assert query.get_base_query() == {'query': {'where': VALID_WHERE_STATEMENT}}
 
 
+def test_base_query_fields_from_strings():
+    query = SnapshotQuery(VALID_WHERE_STATEMENT,
+                          includes="{'company_codes': ['mcrost']}",
+                          select_fields="['an', 'title']")
+    assert query.includes == {'company_codes': ['mcrost']}
+    assert query.select_fields == ['an', 'title']
+    with pytest.raises(ValueError):
+        SnapshotQuery(VALID_WHERE_STATEMENT, excludes="__import__('os').getcwd()")
+
+
 def test_explain_query():
     query = SnapshotQuery(VALID_WHERE_STATEMENT)
     assert query.get_explain_query() == {'query': {'where': VALID_WHERE_STATEMENT}}
@@ -63,6 +73,26 @@ def test_analytics_query_excedes_group_dimensions():
         query.get_analytics_query()
     
 
+def test_analytics_query_reflects_field_changes():
+    query = SnapshotQuery(VALID_WHERE_STATEMENT)
+    first_query = query.get_analytics_query()
+    first_query['query']['top'] = 99
+    assert query.get_analytics_query()['query']['top'] == 10
+    query.top = 20
+    assert query.get_analytics_query()['query']['top'] == 20
+    query.group_dimensions.append('source_code')
+    assert query.get_analytics_query()['query']['group_dimensions'] == ['source_code']
+
+
+def test_analytics_query_revalidates_changed_fields():
+    query = SnapshotQuery(VALID_WHERE_STATEMENT)
+    query.frequency = ' day '
+    assert query.get_analytics_query()['query']['frequency'] == 'DAY'
+    query.date_field = 'invalid_datetime'
+    with pytest.raises(ValueError, match=r'Value invalid_datetime is not within the allowed options'):
+        query.get_analytics_query()
+
+
 def test_extraction_query():
     query = SnapshotQuery(VALID_WHERE_STATEMENT)
     assert query.get_extraction_query() == {'query': {
@@ -0,0 +1,30 @@
+from factiva.news.stream import Stream
+
+VALID_STREAM_ID = 'dj-synhub-stream-abcd1234'
+
+
+def get_subscription_id(suffix):
+    return f'{VALID_STREAM_ID}-filtered-{suffix}'
+
+
+def stream_response(*suffixes):
+    subscriptions = [{'id': get_subscription_id(suffix), 'type': 'subscription'} for suffix in suffixes]
+    return {'data': {'relationships': {'subscriptions': {'data': subscriptions}}}}
+
+
+def test_create_default_subscription(user_key):
+    stream = Stream.__new__(Stream)
+    stream.stream_id = VALID_STREAM_ID
+    stream.stream_user = user_key
+    stream.subscriptions = {}
+
+    stream.create_default_subscription(stream_response('a', 'b'))
+    kept = stream.subscriptions[get_subscription_id('a')]
+    assert list(stream.subscriptions) == [get_subscription_id('a'), get_subscription_id('b')]
+
+    stream.create_default_subscription(stream_response('a', 'c'))
+    assert list(stream.subscriptions) == [get_subscription_id('a'), get_subscription_id('c')]
+    assert stream.subscriptions[get_subscription_id('a')] is kept
+    added = stream.subscriptions[get_subscription_id('c')]
+    assert added.stream_id == VALID_STREAM_ID
+    assert added.listener.subscription_id == added.id
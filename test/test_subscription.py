@@ -0,0 +1,13 @@
+from factiva.news.stream.subscription import Subscription
+
+VALID_STREAM_ID = 'dj-synhub-stream-abcd1234'
+VALID_SUBSCRIPTION_ID = f'{VALID_STREAM_ID}-filtered-xyz'
+
+
+def test_subscription_from_trusted(user_key):
+    subscription = Subscription(VALID_STREAM_ID, VALID_SUBSCRIPTION_ID, 'subscription')
+    trusted = Subscription._from_trusted(VALID_SUBSCRIPTION_ID, VALID_STREAM_ID, 'subscription', user_key)
+    for field in ('url', 'stream_id', 'id', 'subscription_type', 'log'):
+        assert getattr(trusted, field) == getattr(subscription, field)
+    assert subscription.listener is None
+    assert trusted.listener.subscription_id == VALID_SUBSCRIPTION_ID
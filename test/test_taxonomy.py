@@ -1,4 +1,13 @@
+import io
+import math
+
+import pandas as pd
+import pytest
 from factiva.news import Taxonomy
+from factiva.news.taxonomy import taxonomy as taxonomy_module
+from factiva.news.taxonomy.taxonomy import CodeLookup, prepare_category_codes, read_category_csv
+
+CATEGORY_CSV = b'code,description\ni257,Pharmaceuticals\nNA,Not available\n'
 
 
 def test_create_taxonomy_instance():
@@ -20,6 +29,158 @@ def test_get_identifiers_for_category_big_files():
     assert len(industry_codes) > 0
     assert industry_codes.loc['SSYRVO'] is not None
 
+def test_resolve_code():
+    taxonomy = Taxonomy()
+    assert 'description' in taxonomy.resolve_code('industries', 'i25121')
+    assert 'industries' in taxonomy.category_codes
+
+
+def test_resolve_codes():
+    taxonomy = Taxonomy()
+    resolved = taxonomy.resolve_codes('industries', ['i25121', 'not-a-code'])
+    assert 'description' in resolved[0]
+    assert resolved[1] is None
+
+
+def test_read_category_csv_keeps_na_like_codes():
+    codes_df = read_category_csv(io.BytesIO(b'code,description\nNA,Namibia\nNULL,NA\n00123,Numeric\n'))
+    codes_df = prepare_category_codes(codes_df)
+    assert codes_df.index.tolist() == ['NA', 'NULL', '00123']
+    lookup = CodeLookup(codes_df)
+    assert lookup.get('NA') == {'description': 'Namibia'}
+    assert lookup.get('00123') == {'description': 'Numeric'}
+    assert pd.isna(lookup.get('NULL')['description'])
+
+
+def test_prepare_category_codes():
+    codes_df = prepare_category_codes(pd.DataFrame({
+        'executiveFactivaCode': ['E1', 'E2', 'E3', 'E4', 'E5'],
+        'name': ['Ann', 'Bob', 'Cy', 'Di', 'Ed'],
+        'parent': ['P1', 'P1', 'P1', 'P1', 'P2'],
+    }))
+    assert codes_df.index.name == 'code'
+    assert codes_df.index.tolist() == ['E1', 'E2', 'E3', 'E4', 'E5']
+    assert isinstance(codes_df['parent'].dtype, pd.CategoricalDtype)
+    assert not isinstance(codes_df['name'].dtype, pd.CategoricalDtype)
+
+
+def test_code_lookup():
+    codes_df = pd.DataFrame({
+        'code': ['ABC', 'ABC', 'ABC', 'XYZ', 'XYZ'],
+        'exchange': ['XLON', 'XNYS', 'XNAS', 'XPAR', 'XFRA'],
+        'primary_exchange': ['XNYS', 'XNYS', 'XNYS', 'XETR', 'XETR'],
+    }).set_index('code')
+    lookup = CodeLookup(codes_df)
+    assert lookup.get('ABC') == {'exchange': 'XNYS', 'primary_exchange': 'XNYS'}
+    # Without a row on the primary exchange, the first row is used
+    assert lookup.get('XYZ')['exchange'] == 'XPAR'
+    assert lookup.get('not-a-code') is None
+
+    lookup = CodeLookup(pd.DataFrame({'description': ['First', 'Second']}, index=['i1', 'i1']))
+    assert lookup.get('i1') == {'description': 'First'}
+
+
+def test_get_category_codes_cache(monkeypatch, tmp_path, taxonomy, stub_response):
+    sent_headers = []
+    responses = [stub_response(200, CATEGORY_CSV, headers={'ETag': '"v1"'}), stub_response(304)]
+
+    def send_request(method, endpoint_url, headers, stream):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setenv('FACTIVA_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(taxonomy_module.req, 'api_send_request', send_request)
+
+    downloaded = taxonomy.get_category_codes('industries', use_cache=True)
+    cache_path = taxonomy.get_category_cache_path('industries')
+    assert cache_path.suffix in ('.parquet', '.csv')
+    assert cache_path.with_suffix('.etag').read_text() == '"v1"'
+
+    cached = taxonomy.get_category_codes('industries', use_cache=True)
+    assert len(sent_headers) == 1
+    pd.testing.assert_frame_equal(cached, downloaded)
+    assert cached.loc['NA', 'description'] == 'Not available'
+
+    revalidated = taxonomy.get_category_codes('industries', use_cache=True, cache_ttl=0)
+    assert sent_headers[1]['If-None-Match'] == '"v1"'
+    pd.testing.assert_frame_equal(revalidated, downloaded)
+
+
+def test_get_multiple_companies_preserve_input_order(monkeypatch, taxonomy, stub_response):
+    successes = [
+        {'id': 'US0378331005', 'fcode': 'APPLC'},
+        {'id': 'US5949181045', 'fcode': 'MCROST'},
+        {'id': 'US5949181045', 'fcode': 'MCROST'},
+    ]
+    monkeypatch.setattr(taxonomy_module.req, 'api_send_request', lambda **kwargs: stub_response(200))
+    monkeypatch.setattr(taxonomy_module.req, 'api_json',
+                        lambda response: {'data': {'attributes': {'successes': successes}}})
+
+    company_codes = ['US5949181045', 'not-a-code', 'US0378331005', 'US5949181045']
+    companies_df = taxonomy.get_multiple_companies('isin', company_codes, preserve_input_order=True)
+    assert companies_df['id'].tolist() == company_codes
+    assert companies_df['fcode'].tolist()[2:] == ['APPLC', 'MCROST']
+    assert pd.isna(companies_df.loc[1, 'fcode'])
+
+
+def test_get_multiple_companies_records(monkeypatch, taxonomy, stub_response):
+    successes = [
+        {'id': 'US0378331005', 'fcode': 'APPLC', 'tickers': ['AAPL']},
+        {'id': 'US5949181045', 'tickers': ['MSFT', 'MSF']},
+    ]
+    monkeypatch.setattr(taxonomy_module.req, 'api_send_request', lambda **kwargs: stub_response(200))
+    monkeypatch.setattr(taxonomy_module.req, 'api_json',
+                        lambda response: {'data': {'attributes': {'successes': successes}}})
+
+    companies_df = taxonomy.get_multiple_companies('isin', ['US0378331005', 'US5949181045'])
+    pd.testing.assert_frame_equal(companies_df, pd.DataFrame.from_records(successes))
+    assert companies_df.loc[1, 'tickers'] == ['MSFT', 'MSF']
+
+
+def test_get_companies_chunked(monkeypatch, taxonomy):
+    requested_chunks = []
+
+    def get_multiple_companies(code_type, company_codes):
+        requested_chunks.append(company_codes)
+        return pd.DataFrame({'id': company_codes, 'code_type': code_type})
+
+    monkeypatch.setattr(taxonomy, 'get_multiple_companies', get_multiple_companies)
+    company_codes = [f'US{index:010d}' for index in range(7)]
+
+    companies_df = taxonomy.get_companies_chunked('isin', company_codes + company_codes[:2], batch_size=3)
+    assert len(requested_chunks) == math.ceil(len(company_codes) / 3)
+    assert companies_df['id'].tolist() == company_codes
+    assert companies_df.index.tolist() == list(range(len(company_codes)))
+
+    requested_chunks.clear()
+    assert taxonomy.get_company('isin', company_codes)['id'].tolist() == company_codes
+    assert len(requested_chunks) == 1
+
+    requested_chunks.clear()
+    assert taxonomy.get_company('isin', []).empty
+    assert requested_chunks == [[]]
+
+    for batch_size in (0, -1):
+        with pytest.raises(ValueError):
+            taxonomy.get_companies_chunked('isin', company_codes, batch_size=batch_size)
+
+
+def test_get_companies_concurrent(monkeypatch, taxonomy):
+    requested_codes = []
+
+    def get_single_company(code_type, company_code):
+        requested_codes.append(company_code)
+        return pd.DataFrame({'id': [company_code], 'code_type': code_type})
+
+    monkeypatch.setattr(taxonomy, 'get_single_company', get_single_company)
+    company_codes = ['US0378331005', 'US0231351067', 'US5949181045']
+
+    companies_df = taxonomy.get_companies_concurrent('isin', company_codes, max_concurrency=2)
+    assert sorted(requested_codes) == sorted(company_codes)
+    assert companies_df['id'].tolist() == company_codes
+    assert taxonomy.get_companies_concurrent('isin', []).empty
+
+
 def test_request_data_for_company():
     taxonomy = Taxonomy()
     company_data = taxonomy.get_company('isin', company_codes='PLUNMST00014')